@@ -193,10 +193,7 @@ class MarkovChain:
         Return the string representation of the matrix.
         :return: the string representation.
         """
-        s = ""
-        for r in self.transition_matrix():
-            s += "{}\n".format(",".join(map(str, r)))
-        return s
+        return "".join("{}\n".format(",".join(map(str, r))) for r in self.transition_matrix())
 
     def render_graph(self, filename="MarkovChain"):
         graph = Digraph(engine="neato")
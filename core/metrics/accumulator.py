@@ -1,5 +1,14 @@
 from core.metrics.confidence_interval import get_interval_estimation
-from math import sqrt, pow
+from math import sqrt
+from array import array
+import numpy as np
+
+
+# Number of values buffered before being merged into the running statistics
+BUFFER_CAPACITY = 4096
+
+# Minimum number of buffered values for the vectorized merge to pay off
+VECTORIZE_THRESHOLD = 32
 
 
 class WelfordAccumulator:
@@ -8,6 +17,9 @@ class WelfordAccumulator:
         * sample mean
         * sample variance
         * sample standard deviation.
+
+    Values are buffered and merged into the running statistics in blocks, leveraging the
+    parallel variant of the Welford algorithm (Chan et al.).
     """
 
     def __init__(self):
@@ -21,7 +33,10 @@ class WelfordAccumulator:
 
         # statistics
         self._mean = 0.0  # the mean value
-        self._variance = 0.0  # the variance
+        self._variance = 0.0  # the sum of squared deviations from the mean
+
+        # values not yet merged into statistics
+        self._buffer = array("d")
 
     def reset(self):
         """
@@ -31,6 +46,7 @@ class WelfordAccumulator:
         self._n = 0
         self._mean = 0.0
         self._variance = 0.0
+        del self._buffer[:]
 
     def add_value(self, value):
         """
@@ -38,25 +54,55 @@ class WelfordAccumulator:
         :param value: the value to add.
         :return: None
         """
+        self._buffer.append(value)
+        if len(self._buffer) >= BUFFER_CAPACITY:
+            self.flush()
+
+    def flush(self):
+        """
+        Merge the buffered values into the statistics.
+        :return: None
+        """
+        buffer = self._buffer
+        if len(buffer) < VECTORIZE_THRESHOLD:
+            # update mean and variance value by value, leveraging the Welford's algorithm
+            for value in buffer:
+                self._n += 1
+                delta_value = value - self._mean
+                self._variance += delta_value * delta_value * (self._n - 1) / self._n
+                self._mean += delta_value / self._n
+            del buffer[:]
+            return
+
+        values = np.frombuffer(buffer, dtype=np.float64)
+        n_new = values.size
+        mean_new = values.mean()
+        variance_new = float(np.square(values - mean_new).sum())
+        mean_new = float(mean_new)
+
+        # merge mean and variance, leveraging the parallel Welford's algorithm
+        n = self._n + n_new
+        delta_mean = mean_new - self._mean
+        self._variance += variance_new + delta_mean * delta_mean * self._n * n_new / n
+        self._mean += delta_mean * n_new / n
+        self._n = n
 
-        # update mean and variance, leveraging the Welford's algorithm
-        self._n += 1
-        delta_value = value - self._mean
-        self._variance += pow(delta_value, 2) * (1.0 * (self._n - 1) / self._n)
-        self._mean += delta_value / self._n
+        del values
+        del buffer[:]
 
     def samsize(self):
         """
         Return the sample dimension.
         :return: (int) the sample dimension.
         """
-        return self._n
+        return self._n + len(self._buffer)
 
     def mean(self):
         """
         Return the sample mean.
         :return: (float) the sample mean.
         """
+        self.flush()
         return self._mean
 
     def var(self):
@@ -64,6 +110,7 @@ class WelfordAccumulator:
         Return the sample variance.
         :return: (float) the sample variance.
         """
+        self.flush()
         return self._variance / self._n
 
     def sdev(self):
@@ -71,6 +118,7 @@ class WelfordAccumulator:
         Return the sample standard deviation.
         :return: (float) the sample standard deviation.
         """
+        self.flush()
         return sqrt(self._variance / self._n)
 
     def cint(self, alpha):
@@ -79,13 +127,15 @@ class WelfordAccumulator:
         :param alpha: (float) the significance.
         :return: the confidence interval.
         """
-        return get_interval_estimation(self._n, self.sdev(), alpha)
+        sdev = self.sdev()
+        return get_interval_estimation(self._n, sdev, alpha)
 
     def __str__(self):
         """
         String representation.
         :return: the string representation.
         """
+        self.flush()
         sb = ["{attr}={value}".format(attr=attr, value=self.__dict__[attr]) for attr in self.__dict__ if
               not attr.startswith("__") and not callable(getattr(self, attr))]
         return "SampleMeasure({}:{})".format(id(self), ", ".join(sb))
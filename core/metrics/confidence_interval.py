@@ -1,4 +1,5 @@
 from core.rnd.rndf import idfStudent
+from functools import lru_cache
 from math import sqrt
 
 
@@ -11,6 +12,18 @@ def get_interval_estimation(samsize, sdev, alpha):
     :return: (float) the interval gap.
     """
     if samsize > 1:
-        return idfStudent(samsize - 1, 1.0 - (alpha / 2)) * sdev / sqrt(samsize -1)
+        return _idf_student(samsize - 1, 1.0 - (alpha / 2)) * sdev / sqrt(samsize -1)
     else:
         return 0.0
+
+
+@lru_cache(maxsize=256)
+def _idf_student(n, u):
+    """
+    Returns the Student quantile, computed once for every pair of arguments.
+    Notice that every measure in a report shares the same sample size and significance.
+    :param n: (int) the degrees of freedom.
+    :param u: (float) the probability.
+    :return: (float) the Student quantile.
+    """
+    return idfStudent(n, u)
@@ -48,24 +48,46 @@ class Sample:
         :param skip_header: (bool) if True, skip the CSV header.
         :return: None
         """
+        save_csv(filename, self.get_csv_header(), [self.get_csv_row()], append, skip_header)
+
+    def get_csv_header(self):
+        """
+        Retrieves the CSV header of the sample.
+        Notice that the header is the same for every sample.
+        :return: (list(string)) the list of names in header.
+        """
         header = ["time"]
-        sample = [self.time]
 
         for counter in sorted(self.counters.__dict__):
             for sys in SystemScope:
                 for tsk in TaskScope:
                     header.append("{}_{}_{}".format(counter, sys.name.lower(), tsk.name.lower()))
-                    sample.append(getattr(self.counters, counter)[sys][tsk])
 
         for performance_metric in sorted(self.performance_metrics.__dict__):
             for sys in SystemScope:
                 for tsk in TaskScope:
                     header.append("{}_{}_{}".format(performance_metric, sys.name.lower(), tsk.name.lower()))
-                    sample.append(getattr(self.performance_metrics, performance_metric)[sys][tsk])
 
-        data = [sample]
+        return header
+
+    def get_csv_row(self):
+        """
+        Retrieves the CSV row of the sample, with values sorted as in the header.
+        :return: (list) the list of values.
+        """
+        sample = [self.time]
+
+        for counter in sorted(self.counters.__dict__):
+            for sys in SystemScope:
+                for tsk in TaskScope:
+                    sample.append(getattr(self.counters, counter)[sys][tsk])
+
+        for performance_metric in sorted(self.performance_metrics.__dict__):
+            for sys in SystemScope:
+                for tsk in TaskScope:
+                    sample.append(getattr(self.performance_metrics, performance_metric)[sys][tsk])
 
-        save_csv(filename, header, data, append, skip_header)
+        return sample
 
 
 if __name__ == "__main__":
@@ -42,6 +42,14 @@ class SimulationMetrics:
             service_lost={sys: {tsk: BatchedMeasure() for tsk in TaskScope} for sys in SystemScope}
         )
 
+        # All the batched measures, flattened once for batch management
+        self._measures = tuple(
+            measures[sys][tsk]
+            for measures in self.performance_metrics.__dict__.values()
+            for sys in SystemScope
+            for tsk in TaskScope
+        )
+
         # Batch management
         self.n_samples = 0
         self.n_batches = 0
@@ -101,10 +109,8 @@ class SimulationMetrics:
         Discard all batch data.
         :return: None
         """
-        for performance_metric in self.performance_metrics.__dict__:
-            for sys in SystemScope:
-                for tsk in TaskScope:
-                    getattr(self.performance_metrics, performance_metric)[sys][tsk].discard_data()
+        for measure in self._measures:
+            measure.discard_data()
 
         self.n_batches = 0
         self.curr_batchdim = 0
@@ -198,10 +204,8 @@ class SimulationMetrics:
         Registers the current batch of all performance metrics.
         :return: None
         """
-        for performance_metric in self.performance_metrics.__dict__:
-            for sys in SystemScope:
-                for tsk in TaskScope:
-                    getattr(self.performance_metrics, performance_metric)[sys][tsk].register_batch()
+        for measure in self._measures:
+            measure.register_batch()
 
     def save_csv(self, filename, append=False, skip_header=False, batch=None):
         """
@@ -213,15 +217,17 @@ class SimulationMetrics:
         :return: None
         """
         header = ["batch"]
-        data = []
+        measures = []
+        for metric in sorted(self.performance_metrics.__dict__):
+            for sys in SystemScope:
+                for tsk in TaskScope:
+                    header.append("{}_{}_{}".format(metric, sys.name.lower(), tsk.name.lower()))
+                    measures.append(getattr(self.performance_metrics, metric)[sys][tsk])
+
+        # Collect the batch means column-wise, then transpose them into rows
         rng_batches = range(self.n_batches) if batch is None else range(batch, batch+1)
-        for b in rng_batches:
-            sample = [b]
-            for metric in sorted(self.performance_metrics.__dict__):
-                for sys in SystemScope:
-                    for tsk in TaskScope:
-                        header.append("{}_{}_{}".format(metric, sys.name.lower(), tsk.name.lower()))
-                        sample.append(getattr(self.performance_metrics, metric)[sys][tsk].get_value(b))
-            data.append(sample)
+        columns = [rng_batches]
+        columns.extend(measure.get_batch_means()[rng_batches.start:rng_batches.stop] for measure in measures)
+        data = zip(*columns)
 
         save_csv(filename, header, data, append, skip_header)
\ No newline at end of file
@@ -17,12 +17,17 @@ Keep in mind the following table:
 ╚════════════╩═════╩═══════╩════════════╩═════════════════════╝
 """
 
-import math
+import numpy as np
+from functools import lru_cache
 from core.utils import mathutils
 from core.utils.guiutils import print_progress
 from core.utils.mathutils import _g
 
 
+# Number of candidates checked at once by the vectorized scans
+_SCAN_CHUNK = 1 << 20
+
+
 def get_fp_multipliers(modulus):
     """
     Generate a list of FP multipliers w.r.t the specified modulus.
@@ -51,15 +56,14 @@ def get_mc_multipliers(modulus):
     """
     Generate a list of MC multipliers w.r.t the specified modulus.
     :param modulus: a prime number.
-    :return: (List) MC multipliers w.r.t modulus.
+    :return: (numpy.ndarray) MC multipliers w.r.t modulus, in ascending order.
     """
     mc_multipliers = []
-    for i in range(1, modulus):
-        is_mcm = is_mc_multiplier(i, modulus)
-        if is_mcm:
-            mc_multipliers.append(i)
-        print_progress(i, modulus)
-    return mc_multipliers
+    for start in range(1, modulus, _SCAN_CHUNK):
+        candidates = np.arange(start, min(start + _SCAN_CHUNK, modulus), dtype=np.int64)
+        mc_multipliers.append(candidates[(modulus % candidates) < (modulus // candidates)])
+        print_progress(candidates[-1], modulus - 1)
+    return np.concatenate(mc_multipliers) if mc_multipliers else np.empty(0, dtype=np.int64)
 
 
 def get_first_fp_multiplier(modulus):
@@ -103,7 +107,8 @@ def generate_fpmc_multipliers(multiplier, modulus):
     i = 1
     x = multiplier
     while x != 1:
-        if is_mc_multiplier(multiplier, modulus) and mathutils.gcd(i, modulus - 1):
+        # Notice that the MC check (a division) is cheaper than the coprimality check (a gcd), hence it comes first.
+        if is_mc_multiplier(x, modulus) and mathutils.are_coprime(i, modulus - 1):
             multipliers.append(x)
         i += 1
         x = _g(x, multiplier, modulus)
@@ -117,12 +122,9 @@ def is_fp_multiplier(multiplier, modulus):
     :param modulus: a prime number.
     :return: True if multiplier is a FP multiplier w.r.t. modulus.
     """
-    period = 1
-    x = multiplier
-    while x != 1:
-        period += 1
-        x = (multiplier * x) % modulus
-    return period == (modulus - 1)
+    # Notice that multiplier has period modulus-1 iff multiplier^((modulus-1)/p) != 1 for every prime factor p
+    # of modulus-1, i.e. iff it is a primitive root of modulus.
+    return all(pow(multiplier, exponent, modulus) != 1 for exponent in _fp_exponents(modulus))
 
 
 def is_mc_multiplier(multiplier, modulus):
@@ -132,7 +134,17 @@ def is_mc_multiplier(multiplier, modulus):
     :param modulus: a prime number.
     :return: True if multiplier is a MC multiplier w.r.t. modulus.
     """
-    return (modulus % multiplier) < math.floor(modulus / multiplier)
+    return (modulus % multiplier) < (modulus // multiplier)
+
+
+@lru_cache(maxsize=16)
+def _fp_exponents(modulus):
+    """
+    Computes the exponents (modulus-1)/p, for every prime factor p of modulus-1.
+    :param modulus: a prime number.
+    :return: (tuple) the exponents.
+    """
+    return tuple((modulus - 1) // p for p in mathutils.prime_factors(modulus - 1))
 
 
 def _test():
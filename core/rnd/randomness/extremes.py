@@ -6,47 +6,146 @@ BINS = 1000         # BINS >= 1000
 D = 5               # D >= 2
 CONFIDENCE = 0.95   # CONFIDENCE >= 0.95
 """
-import math
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from functools import lru_cache
 from core.rnd.rndf import idfChisquare
+from core.rnd.rndgen import MarcianiSingleStream
 from core.utils import errutils
-from core.utils import mathutils
 from core.utils.guiutils import print_progress
 
 
-def statistics(generator, samsize, bins, d):
-    data = []
-    streams = generator.get_nstreams()
-    for stream in range(streams):
-        generator.stream(stream)
-        observed = observations(generator, samsize, bins, d)
-        chi = _compute_chisquare_statistic(observed, samsize)
-        result = (stream, chi)
-        data.append(result)
-        print_progress(stream, streams)
-    return data
+def statistics(generator, samsize, bins, d, workers=1):
+    """
+    Compute the chi-square statistic of the extremes for every stream of the generator.
+    Notice that every stream is tested on its own single-stream generator, seeded with the current seed of the stream,
+    so that streams can be tested in parallel by a pool of processes. In any case, the given generator is left untouched.
+    :param generator: the multi-stream rnd number generator.
+    :param samsize: the sample size.
+    :param bins: the number of bins.
+    :param d: the number of uniforms for each extreme.
+    :param workers: (int) the number of processes; if 1, streams are tested sequentially; if None, the number of CPUs.
+    Default is 1.
+    :return: (list(tuple)) the list of (stream, chi), sorted by stream.
+    """
+    modulus = generator.get_modulus()
+    multiplier = generator.get_multiplier()
+    seeds = generator.get_seeds()
+    streams = len(seeds)
+
+    # Notice that the observed frequencies of all streams are stored as a single (streams, bins) array,
+    # so that the chi-square statistics are computed at once.
+    observed = np.empty((streams, bins), dtype=np.int64)
+
+    if workers == 1:
+        for stream, seed in enumerate(seeds):
+            observed[stream] = _stream_observations(seed, modulus, multiplier, samsize, bins, d)
+            print_progress(stream, streams)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = {executor.submit(_stream_observations, seed, modulus, multiplier, samsize, bins, d): stream
+                       for stream, seed in enumerate(seeds)}
+            for done, future in enumerate(as_completed(futures)):
+                observed[futures[future]] = future.result()
+                print_progress(done, streams)
+
+    return list(enumerate(_chisquare_statistics(observed, samsize).tolist()))
+
+
+def _stream_observations(seed, modulus, multiplier, samsize, bins, d):
+    """
+    Compute the observed frequencies of the extremes for a stream.
+    :param seed: (int) the current seed of the stream.
+    :param modulus: (int) the modulus of the generator.
+    :param multiplier: (int) the multiplier of the generator.
+    :param samsize: the sample size.
+    :param bins: the number of bins.
+    :param d: the number of uniforms for each extreme.
+    :return: (numpy.ndarray) the observed frequencies.
+    """
+    generator = MarcianiSingleStream(iseed=seed, modulus=modulus, multiplier=multiplier)
+    return _histogram(generator, samsize, bins, d)
 
 
 def observations(generator, samsize, bins, d):
+    """
+    Compute the observed frequencies of the extremes, i.e. of max(u_1,...,u_d)^d, within the given bins.
+    Notice that if the generator supports bulk generation, the sample is drawn and binned as a whole.
+    :param generator: the rnd number generator.
+    :param samsize: the sample size.
+    :param bins: the number of bins.
+    :param d: the number of uniforms for each extreme.
+    :return: (list(int)) the observed frequencies.
+    """
+    return _histogram(generator, samsize, bins, d).tolist()
+
+
+def _histogram(generator, samsize, bins, d):
+    """
+    Compute the observed frequencies of the extremes, as an array (see observations).
+    :param generator: the rnd number generator.
+    :param samsize: the sample size.
+    :param bins: the number of bins.
+    :param d: the number of uniforms for each extreme.
+    :return: (numpy.ndarray) the observed frequencies.
+    """
+    if not hasattr(generator, "rnd_array"):
+        return np.array(_observations_scalar(generator, samsize, bins, d), dtype=np.int64)
+
+    # Notice that the extremes are raised and scaled in place, so that no other sample-sized temporaries are allocated
+    u = generator.rnd_array(samsize * d).reshape(samsize, d).max(axis=1)
+    u **= d
+    u *= bins
+    return np.bincount(u.astype(np.int64), minlength=bins)
+
+
+def _observations_scalar(generator, samsize, bins, d):
+    """
+    Compute the observed frequencies of the extremes, drawing one uniform at a time.
+    :param generator: the rnd number generator.
+    :param samsize: the sample size.
+    :param bins: the number of bins.
+    :param d: the number of uniforms for each extreme.
+    :return: (list(int)) the observed frequencies.
+    """
+    rnd = generator.rnd
+    others = range(1, d)
+
     observed = [0] * bins
     for _ in range(samsize):
-        u1 = generator.rnd()
-        for _ in range(1, d):
-            u2 = generator.rnd()
+        u1 = rnd()
+        for _ in others:
+            u2 = rnd()
             if u2 > u1:
                 u1 = u2
-        u = u1 ** d
-        b = math.floor(u * bins)
-        observed[int(b)] += 1
+        # Notice that u1^d is in [0,1), hence truncation equals flooring
+        observed[int(u1 ** d * bins)] += 1
     return observed
 
 
 def _compute_chisquare_statistic(observed, samsize):
-    bins = len(observed)
-    expected = lambda x: samsize / bins
-    value = mathutils.chisquare_univariate(observed, expected)
-    return value
+    """
+    Compute the chi-square statistic of the observed frequencies, w.r.t. the uniform expected frequency.
+    :param observed: (list(int)) the observed frequencies.
+    :param samsize: the sample size.
+    :return: the chi-square statistic.
+    """
+    return float(_chisquare_statistics(np.asarray(observed, dtype=np.int64).reshape(1, -1), samsize)[0])
+
+
+def _chisquare_statistics(observed, samsize):
+    """
+    Compute the chi-square statistics of many observed frequencies at once, one for every row.
+    :param observed: (numpy.ndarray) the (streams, bins) observed frequencies.
+    :param samsize: the sample size.
+    :return: (numpy.ndarray) the chi-square statistics, by row.
+    """
+    expected = samsize / observed.shape[1]
+    deviations = observed - expected
+    return np.square(deviations, out=deviations).sum(axis=1) / expected
 
 
+@lru_cache(maxsize=64)
 def critical_min(bins, confidence):
     """
     Compute the two-tailed critical min value.
@@ -57,6 +156,7 @@ def critical_min(bins, confidence):
     return idfChisquare(bins - 1, (1 - confidence) / 2)
 
 
+@lru_cache(maxsize=64)
 def critical_max(bins, confidence):
     """
     Compute the two-tailed critical max value.
@@ -5,35 +5,48 @@ Spectral Test
 DEFAULT_INTERVAL = (0.0, 1.0)
 """
 from core.utils.guiutils import print_progress
-from core.utils.file_utils import empty_file
-from core.utils.csv_utils import save_csv
+from core.utils.file_utils import create_dir_tree
+from core.utils.csv_utils import str_csv
 
-# Number of observations in memory before flushing into file
-MAX_OBSERVATIONS_BEFORE_FLUSH = 10
+# Number of uniforms drawn at once, if the generator supports bulk generation
+BATCH_SIZE = 4096
 
 
 def statistics(filename, rndgen, samsize, interval):
-    empty_file(filename)
-
     header = ["u1", "u2"]
 
     low = interval[0]
     high = interval[1]
 
-    observed = []
     found = 0
 
-    u1 = rndgen.rnd()
-    for i in range(1, samsize):
-        u2 = rndgen.rnd()
-        if low <= u1 <= high and low <= u2 <= high:
-            found += 1
-            observed.append((u1, u2))
-            print_progress(i, samsize, message="Found {}".format(found))
-        u1 = u2
-
-        if len(observed) == MAX_OBSERVATIONS_BEFORE_FLUSH:
-            save_csv(filename, header, observed, append=True)
-            del observed[:]
-    if len(observed) != 0:
-        save_csv(filename, header, observed, append=True)
\ No newline at end of file
+    # Notice that the file is kept open for the whole test, and observations are written as they are found.
+    create_dir_tree(filename)
+    with open(filename, "w") as f:
+        f.write(",".join(map(str_csv, header)) + "\n")
+
+        uniforms = _uniforms(rndgen, samsize)
+        u1 = next(uniforms, None)
+        for i, u2 in enumerate(uniforms, 1):
+            if low <= u1 <= high and low <= u2 <= high:
+                found += 1
+                f.write("{},{}\n".format(u1, u2))
+                print_progress(i, samsize, message="Found {}".format(found))
+            u1 = u2
+
+
+def _uniforms(rndgen, samsize):
+    """
+    Generate the sequence of uniforms to test.
+    Notice that if the generator supports bulk generation, uniforms are drawn in batches.
+    :param rndgen: the rnd number generator.
+    :param samsize: the sample size.
+    :return: (generator) the *samsize* uniforms.
+    """
+    if not hasattr(rndgen, "rnd_batch"):
+        for _ in range(samsize):
+            yield rndgen.rnd()
+        return
+
+    for start in range(0, samsize, BATCH_SIZE):
+        yield from rndgen.rnd_batch(min(BATCH_SIZE, samsize - start))
@@ -8,6 +8,9 @@ Suggested configurations:
 | 32   | 256     | 2147483647 | 50812      | 29872  | 8362647   | Succeeded     | Failed (94.531% confidence)    | Succeeded                  |
 
 """
+from array import array
+
+import numpy as np
 
 DEFAULT_MODULUS = 2147483647
 DEFAULT_MULTIPLIER = 48271
@@ -15,6 +18,13 @@ DEFAULT_STREAMS = 128
 DEFAULT_JUMPER = 40509
 DEFAULT_ISEED = 123456789
 
+# The Mersenne prime 2^31-1: for this modulus, the Lehmer step reduces with shifts and masks, instead of divisions.
+MERSENNE_MODULUS = 0x7fffffff
+MERSENNE_EXPONENT = 31
+
+# The greatest modulus whose squared residues fit into int64, as required by the array generation.
+MAX_ARRAY_MODULUS = 3037000499
+
 
 class MarcianiMultiStream(object):
     """
@@ -48,9 +58,16 @@ class MarcianiMultiStream(object):
         self._streams = streams
         self._jumper = jumper
 
-        self._init = False
+        # Schrage decomposition of the modulus, w.r.t. the multiplier and the jumper
+        self._Q = self._modulus // self._multiplier
+        self._R = self._modulus % self._multiplier
+        self._Qj = self._modulus // self._jumper
+        self._Rj = self._modulus % self._jumper
+        self._inv_modulus = 1.0 / self._modulus  # scales seeds into [0,1) with a multiplication
+        self._fast = self._modulus == MERSENNE_MODULUS
+        # Stream selection by masking, when the number of streams is a power of 2
+        self._stream_mask = self._streams - 1 if self._streams & (self._streams - 1) == 0 else None
 
-        self._seeds = [int(self._iseed)] * self._streams
         self.plant_seeds(self._iseed)
 
     def plant_seeds(self, x):
@@ -58,20 +75,21 @@ class MarcianiMultiStream(object):
         Initializes all the streams of the generator.
         :param x: (int) the initial seed.
         """
-        Q = int(self._modulus / self._jumper)
-        R = int(self._modulus % self._jumper)
-
-        self._init = True
-        s = self._stream
-        self.stream(0)
-        self.put_seed(x)
-        self._stream = s
-        for j in range(1, self._streams):
-            x = int(self._jumper * (self._seeds[j - 1] % Q) - R * int((self._seeds[j - 1] / Q)))
-            if x > 0:
-                self._seeds[j] = x
-            else:
-                self._seeds[j] = x + self._modulus
+        if x <= 0:
+            raise ValueError(
+                "x must be a positive number in (0, modulus). Found {}".format(
+                    x))
+        Q = self._Qj
+        R = self._Rj
+
+        x = int(x) % self._modulus
+        seeds = [x]
+        for _ in range(1, self._streams):
+            x = self._jumper * (x % Q) - R * (x // Q)
+            if x <= 0:
+                x += self._modulus
+            seeds.append(x)
+        self._seeds = array("q", seeds)
 
     def get_initial_seed(self):
         """
@@ -115,6 +133,13 @@ class MarcianiMultiStream(object):
         """
         return self._seeds[self._stream]
 
+    def get_seeds(self):
+        """
+        Retrieves the seeds of all the streams.
+        :return: (list(int)) the seeds, indexed by stream.
+        """
+        return list(self._seeds)
+
     def put_seed(self, x):
         """
         Initializes the current stream with the specified seed.
@@ -133,26 +158,126 @@ class MarcianiMultiStream(object):
         Selects the current stream.
         :param stream_id: stream index in [0,STREAMS-1]
         """
-        self._stream = stream_id % self._streams
-        if self._init is False and self._stream != 0:
-            self.plant_seeds(self._iseed)
+        if self._stream_mask is not None:
+            self._stream = stream_id & self._stream_mask
+        else:
+            self._stream = stream_id % self._streams
 
     def rnd(self):
         """
         Generates a pseudo-rnd number from uniform distribution in [0,1)
         :return: a uniform pseudo-rnd float in [0,1)
         """
-        Q = int(self._modulus / self._multiplier)
-        R = int(self._modulus % self._multiplier)
+        if self._fast:
+            t = self._multiplier * self._seeds[self._stream]
+            t = (t & MERSENNE_MODULUS) + (t >> MERSENNE_EXPONENT)
+            if t >= MERSENNE_MODULUS:
+                t -= MERSENNE_MODULUS
+            self._seeds[self._stream] = t
+            return t * self._inv_modulus
+
+        Q = self._Q
+        R = self._R
 
-        t = int(self._multiplier * (self._seeds[self._stream] % Q) -
-                R * int(self._seeds[self._stream] / Q))
+        t = self._multiplier * (self._seeds[self._stream] % Q) - R * (self._seeds[self._stream] // Q)
         if t > 0:
-            self._seeds[self._stream] = int(t)
+            self._seeds[self._stream] = t
+        else:
+            self._seeds[self._stream] = t + self._modulus
+
+        return self._seeds[self._stream] * self._inv_modulus
+
+    def rnd_stream(self, stream_id):
+        """
+        Selects the current stream and generates a pseudo-rnd number from uniform distribution in [0,1).
+        Equivalent to *stream(stream_id)* followed by *rnd()*, in a single call.
+        :param stream_id: stream index in [0,STREAMS-1]
+        :return: a uniform pseudo-rnd float in [0,1)
+        """
+        if self._stream_mask is not None:
+            self._stream = stream = stream_id & self._stream_mask
+        else:
+            self._stream = stream = stream_id % self._streams
+
+        if self._fast:
+            t = self._multiplier * self._seeds[stream]
+            t = (t & MERSENNE_MODULUS) + (t >> MERSENNE_EXPONENT)
+            if t >= MERSENNE_MODULUS:
+                t -= MERSENNE_MODULUS
+        else:
+            t = self._multiplier * (self._seeds[stream] % self._Q) - self._R * (self._seeds[stream] // self._Q)
+            if t <= 0:
+                t += self._modulus
+        self._seeds[stream] = t
+
+        return t * self._inv_modulus
+
+    def rnd_batch(self, n):
+        """
+        Generates a batch of pseudo-rnd numbers from uniform distribution in [0,1), drawn from the current stream.
+        The batch is equivalent to *n* consecutive calls of *rnd()*, but the recurrence runs in a single frame.
+        :param n: (int) the number of pseudo-rnd numbers to generate.
+        :return: (list(float)) the list of *n* uniform pseudo-rnd floats in [0,1).
+        """
+        modulus = self._modulus
+        inv_modulus = self._inv_modulus
+        multiplier = self._multiplier
+        Q = self._Q
+        R = self._R
+
+        batch = [0.0] * n
+        x = self._seeds[self._stream]
+        if self._fast:
+            for i in range(n):
+                x *= multiplier
+                x = (x & MERSENNE_MODULUS) + (x >> MERSENNE_EXPONENT)
+                if x >= MERSENNE_MODULUS:
+                    x -= MERSENNE_MODULUS
+                batch[i] = x * inv_modulus
+        else:
+            for i in range(n):
+                x = multiplier * (x % Q) - R * (x // Q)
+                if x <= 0:
+                    x += modulus
+                batch[i] = x * inv_modulus
+        self._seeds[self._stream] = x
+
+        return batch
+
+    def rnd_array(self, n):
+        """
+        Generates an array of pseudo-rnd numbers from uniform distribution in [0,1), drawn from the current stream.
+        The array is equivalent to *rnd_batch(n)*, but the recurrence is computed by NumPy (see _lehmer_array).
+        :param n: (int) the number of pseudo-rnd numbers to generate.
+        :return: (numpy.ndarray) the array of *n* uniform pseudo-rnd floats in [0,1).
+        """
+        if self._modulus > MAX_ARRAY_MODULUS:
+            return np.array(self.rnd_batch(n))
+
+        states = _lehmer_array(self._seeds[self._stream], n, self._multiplier, self._modulus)
+        if n > 0:
+            self._seeds[self._stream] = int(states[-1])
+
+        return states * self._inv_modulus
+
+    def rnd_all(self):
+        """
+        Generates a pseudo-rnd number from uniform distribution in [0,1) for every stream, advancing all streams at once.
+        The i-th value is equivalent to a call of *rnd()* on the i-th stream.
+        The current stream is not changed.
+        :return: (numpy.ndarray) the array of uniform pseudo-rnd floats in [0,1), indexed by stream.
+        """
+        seeds = np.frombuffer(self._seeds, dtype=np.int64).copy()
+        if self._fast:
+            seeds *= self._multiplier
+            seeds = (seeds & MERSENNE_MODULUS) + (seeds >> MERSENNE_EXPONENT)
+            np.subtract(seeds, MERSENNE_MODULUS, out=seeds, where=seeds >= MERSENNE_MODULUS)
         else:
-            self._seeds[self._stream] = int(t + self._modulus)
+            seeds = self._multiplier * (seeds % self._Q) - self._R * (seeds // self._Q)
+            np.add(seeds, self._modulus, out=seeds, where=seeds <= 0)
+        np.frombuffer(self._seeds, dtype=np.int64)[:] = seeds
 
-        return float(self._seeds[self._stream] / self._modulus)
+        return seeds * self._inv_modulus
     
 
 class MarcianiSingleStream:
@@ -177,6 +302,12 @@ class MarcianiSingleStream:
         self._seed = iseed
         self._modulus = modulus
         self._multiplier = multiplier
+
+        # Schrage decomposition of the modulus, w.r.t. the multiplier
+        self._Q = self._modulus // self._multiplier
+        self._R = self._modulus % self._multiplier
+        self._inv_modulus = 1.0 / self._modulus  # scales seeds into [0,1) with a multiplication
+        self._fast = self._modulus == MERSENNE_MODULUS
         
     def get_initial_seed(self):
         """
@@ -215,23 +346,107 @@ class MarcianiSingleStream:
             x %= self._modulus
         else:
             raise ValueError("x must be a positive number in (0, modulus). Found {}".format(x))
-        
+        self._seed = int(x)
+
     def rnd(self):
         """
         Generates a pseudo-rnd number from uniform distribution in [0,1)
         :return: a uniform pseudo-rnd float in [0,1)
         """
-        Q = int(self._modulus / self._multiplier)
-        R = int(self._modulus % self._multiplier)
+        if self._fast:
+            t = self._multiplier * self._seed
+            t = (t & MERSENNE_MODULUS) + (t >> MERSENNE_EXPONENT)
+            if t >= MERSENNE_MODULUS:
+                t -= MERSENNE_MODULUS
+            self._seed = t
+            return t * self._inv_modulus
+
+        Q = self._Q
+        R = self._R
     
-        t = int(self._multiplier * (self._seed % Q) - R * int(self._seed / Q))
+        t = self._multiplier * (self._seed % Q) - R * (self._seed // Q)
         
         if t > 0:
-            self._seed = int(t)
+            self._seed = t
         else:
-            self._seed = int(t + self._modulus)
+            self._seed = t + self._modulus
     
-        return float(self._seed / self._modulus)
+        return self._seed * self._inv_modulus
+
+    def rnd_batch(self, n):
+        """
+        Generates a batch of pseudo-rnd numbers from uniform distribution in [0,1).
+        The batch is equivalent to *n* consecutive calls of *rnd()*, but the recurrence runs in a single frame.
+        :param n: (int) the number of pseudo-rnd numbers to generate.
+        :return: (list(float)) the list of *n* uniform pseudo-rnd floats in [0,1).
+        """
+        modulus = self._modulus
+        inv_modulus = self._inv_modulus
+        multiplier = self._multiplier
+        Q = self._Q
+        R = self._R
+
+        batch = [0.0] * n
+        x = self._seed
+        if self._fast:
+            for i in range(n):
+                x *= multiplier
+                x = (x & MERSENNE_MODULUS) + (x >> MERSENNE_EXPONENT)
+                if x >= MERSENNE_MODULUS:
+                    x -= MERSENNE_MODULUS
+                batch[i] = x * inv_modulus
+        else:
+            for i in range(n):
+                x = multiplier * (x % Q) - R * (x // Q)
+                if x <= 0:
+                    x += modulus
+                batch[i] = x * inv_modulus
+        self._seed = x
+
+        return batch
+
+    def rnd_array(self, n):
+        """
+        Generates an array of pseudo-rnd numbers from uniform distribution in [0,1).
+        The array is equivalent to *rnd_batch(n)*, but the recurrence is computed by NumPy (see _lehmer_array).
+        :param n: (int) the number of pseudo-rnd numbers to generate.
+        :return: (numpy.ndarray) the array of *n* uniform pseudo-rnd floats in [0,1).
+        """
+        if self._modulus > MAX_ARRAY_MODULUS:
+            return np.array(self.rnd_batch(n))
+
+        states = _lehmer_array(self._seed, n, self._multiplier, self._modulus)
+        if n > 0:
+            self._seed = int(states[-1])
+
+        return states * self._inv_modulus
+
+
+def _lehmer_array(x, n, multiplier, modulus):
+    """
+    Computes the *n* states of the Lehmer recurrence following the state *x*, as a whole.
+    Notice that states are computed by doubling: the states in [k,2k) are the states in [0,k), jumped by
+    multiplier^k (mod modulus). Hence, the products are bounded by modulus^2 (see MAX_ARRAY_MODULUS).
+    :param x: (int) the current state.
+    :param n: (int) the number of states to compute.
+    :param multiplier: (int) the multiplier.
+    :param modulus: (int) the modulus.
+    :return: (numpy.ndarray) the array of the *n* states following *x*.
+    """
+    states = np.empty(n, dtype=np.int64)
+    if n == 0:
+        return states
+
+    states[0] = multiplier * x % modulus
+    k = 1
+    while k < n:
+        size = min(k, n - k)
+        block = states[k:k + size]
+        np.multiply(states[:size], pow(multiplier, k, modulus), out=block)
+        np.remainder(block, modulus, out=block)
+        k += size
+
+    return states
 
 
 if __name__ == "__main__":
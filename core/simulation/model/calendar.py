@@ -1,4 +1,4 @@
-from queue import PriorityQueue
+import heapq
 import logging
 
 # Configure logger
@@ -6,6 +6,7 @@ from core.simulation.model.event import EventType
 from core.simulation.model.scope import ActionScope, SystemScope, TaskScope
 
 logger = logging.getLogger(__name__)
+DEBUG = logging.DEBUG
 
 
 class NextEventCalendar:
@@ -16,7 +17,7 @@ class NextEventCalendar:
         (ii) scheduling of only possible events, that are:
             (ii.i) possible arrivals, i.e. arrivals with occurrence time lower than stop time.
             (ii.ii) departures of possible arrivals.
-        (iii) unscheduling of events to ignore.
+        (iii) unscheduling of events to ignore, i.e. events marked as not active.
     """
 
     def __init__(self, t_clock=0.0, t_stop=float("inf")):
@@ -28,8 +29,8 @@ class NextEventCalendar:
         self._clock = t_clock  # the simulation clock
         self._stop = t_stop  # the stop time
 
-        self._events = PriorityQueue()  # the event list, implemented as a priority queue
-        self._ignore = set()  # the set of events to ignore (unscheduled events), processed lazily
+        self._events = []  # the event list, implemented as a binary heap of (time, counter, event)
+        self._counter = 0  # the scheduling counter, used as tie-breaker between events with the same time
 
     def get_clock(self):
         """
@@ -51,62 +52,95 @@ class NextEventCalendar:
         :param events: (SimpleEvent) the events to schedule.
         :return: (int,int) (ns,ni), where *ns* is the number of scheduled tasks, and *ni* is the number of ignored tasks.
         """
+        return self.schedule_many(events)
+
+    def schedule_many(self, events):
+        """
+        Schedule a collection of events.
+        :param events: (iterable(SimpleEvent)) the events to schedule.
+        :return: (int,int) (ns,ni), where *ns* is the number of scheduled tasks, and *ni* is the number of ignored tasks.
+        """
         nscheduled = 0
         nignored = 0
 
+        heap = self._events
+        stop = self._stop
+        debug = logger.isEnabledFor(DEBUG)
         for e in events:
-            if e.type.act is ActionScope.ARRIVAL and e.time >= self._stop:
-                logger.debug("Not scheduled (impossible): {}".format(e))
+            if e.type.act is ActionScope.ARRIVAL and e.time >= stop:
+                if debug:
+                    logger.debug("Not scheduled (impossible): %s", e)
                 nignored += 1
             else:
                 try:
-                    self._events.put((e.time, e))
+                    heapq.heappush(heap, (e.time, self._counter, e))
+                    self._counter += 1
                     nscheduled += 1
                 except TypeError as exc:
                     print("Error: {} : {}".format(str(exc), e))
                     continue
-                logger.debug("Scheduled: {}".format(e))
+                if debug:
+                    logger.debug("Scheduled: %s", e)
 
         return nscheduled, nignored
 
     def unschedule(self, *events):
         """
         Unschedule events.
-        :param events: (SimpleEvent) the events to unschedule.
+        Notice that unscheduled events are marked as not active, and are discarded lazily.
+        :param events: (SimpleEvent) the events to unschedule, i.e. the very events previously scheduled.
+        """
+        self.unschedule_many(events)
+
+    def unschedule_many(self, events):
+        """
+        Unschedule a collection of events.
+        Notice that unscheduled events are marked as not active, and are discarded lazily.
+        :param events: (iterable(SimpleEvent)) the events to unschedule, i.e. the very events previously scheduled.
         """
+        debug = logger.isEnabledFor(DEBUG)
         for e in events:
-            self._ignore.add(e)
-            logger.debug("Unscheduled: {}".format(e))
+            e.active = False
+            if debug:
+                logger.debug("Unscheduled: %s", e)
 
     def get_next_event(self):
         """
         Retrieve the next scheduled event and update the clock.
         :return: (SimpleEvent) the next event, if present; None, otherwise.
         """
-        if self._events.empty():
+        # Notice that unscheduled events are discarded lazily, i.e. when they reach the head of the queue.
+        self._discard_inactive()
+        if not self._events:
             logger.debug("Event queue is empty, next event is None")
             return None
-        else:
-            candidate = self._events.get()[1]
-            while candidate in self._ignore:
-                #assert candidate.type == EventType.COMPLETION_CLOUDLET_TASK_2  # TODO eliminare
-                logger.debug("Ignoring next event (unscheduled): {}".format(candidate))
-                self._ignore.discard(candidate)
-                candidate = self._events.get()[1]
-            self.set_clock(candidate.time)
-            return candidate
+        candidate = heapq.heappop(self._events)[2]
+        self.set_clock(candidate.time)
+        return candidate
 
     def empty(self):
         """
         Check if the calendar is empty.
+        Notice that a calendar holding only unscheduled events is empty.
         :return: True, if the calendar is empty; False, otherwise.
         """
-        return self._events.empty()
+        self._discard_inactive()
+        return not self._events
+
+    def _discard_inactive(self):
+        """
+        Discard the unscheduled events at the head of the queue.
+        :return: None
+        """
+        heap = self._events
+        while heap and not heap[0][2].active:
+            if logger.isEnabledFor(DEBUG):
+                logger.debug("Ignoring next event (unscheduled): %s", heap[0][2])
+            heapq.heappop(heap)
 
     def __str__(self):
         """
         String representation.
         :return: the string representation.
         """
-        sb = ["{attr}='{value}'".format(attr=attr, value=self.__dict__[attr]) for attr in self.__dict__ if not attr.startswith("__") and not callable(getattr(self, attr))]
-        return "Calendar({}:{})".format(id(self), ", ".join(sb))
\ No newline at end of file
+        return "Calendar({}:clock={}, stop={}, events={})".format(id(self), self._clock, self._stop, len(self._events))
\ No newline at end of file
@@ -48,6 +48,7 @@ class SimpleCloud:
 
         # Metrics
         self.metrics = metrics
+        self._population_area = self.metrics.counters.population_area[SystemScope.CLOUD]
 
     # ==================================================================================================================
     # EVENT SUBMISSION
@@ -72,13 +73,9 @@ class SimpleCloud:
         self.metrics.counters.arrived[SystemScope.CLOUD][tsk] += 1
         if restart:
             self.metrics.counters.switched[SystemScope.CLOUD][tsk] += 1
-        self.metrics.counters.population_area[SystemScope.CLOUD][tsk] += (t_now - self.t_last_event[tsk]) * self.state[tsk]
 
-        # Update state
-        self.state[tsk] += 1
-
-        # Update timing
-        self.t_last_event[tsk] = t_now
+        # Update state and timing
+        self._update_population(tsk, t_now, 1)
 
         return t_completion
 
@@ -103,23 +100,33 @@ class SimpleCloud:
         if switched:
             self.metrics.counters.switched_completed[SystemScope.CLOUD][tsk] += 1
             self.metrics.counters.switched_service[SystemScope.CLOUD][tsk] += t_served
-        self.metrics.counters.population_area[SystemScope.CLOUD][tsk] += (t_now - self.t_last_event[tsk]) * self.state[tsk]
-
-        # Update state
-        self.state[tsk] -= 1
 
-        # Update timing
-        self.t_last_event[tsk] = t_now
+        # Update state and timing
+        self._update_population(tsk, t_now, -1)
 
     # ==================================================================================================================
     # OTHER
     # ==================================================================================================================
+
+    def _update_population(self, tsk, t_now, delta):
+        """
+        Updates the population area, the state and the timing for the given type of task.
+        :param tsk: (TaskType) the type of the task.
+        :param t_now: (float) the current time.
+        :param delta: (int) the population variation, e.g. +1 on arrival and -1 on departure.
+        :return: None
+        """
+        self._population_area[tsk] += (t_now - self.t_last_event[tsk]) * self.state[tsk]
+        self.state[tsk] += delta
+        self.t_last_event[tsk] = t_now
+
     def is_idle(self):
         """
         Check weather the Cloud is idle or not.
         :return: True, if the Cloud is idle; False, otherwise.
         """
-        return sum(self.state[tsk] for tsk in TaskScope.concrete()) == 0
+        # Notice that the state only holds concrete task scopes, whose populations are never negative.
+        return not any(self.state.values())
 
     def __str__(self):
         """
@@ -1,4 +1,5 @@
 from core.simulation.model.server import SimpleServer as Server
+from core.simulation.model.event import SimpleEvent as Event
 from core.simulation.model.event import EventType
 from core.simulation.model.scope import SystemScope
 from core.simulation.model.scope import ActionScope
@@ -40,6 +41,7 @@ class SimpleCloudlet:
 
         # State
         self.state = state
+        self.completions = [None] * self.n_servers  # the scheduled completion events (SimpleEvent), by server index
 
         # Controller
         controller_algorithm = config["controller_algorithm"]
@@ -60,6 +62,7 @@ class SimpleCloudlet:
 
         # Metrics
         self.metrics = metrics
+        self._population_area = self.metrics.counters.population_area[SystemScope.CLOUDLET]
 
     # ==================================================================================================================
     # EVENT SUBMISSION
@@ -73,38 +76,35 @@ class SimpleCloudlet:
         Submit the arrival of a task.
         :param tsk: (TaskType) the type of the task.
         :param t_now: (float) the current time.
-        :return: (float) the completion time.
+        :return: (SimpleEvent) the completion event to schedule.
         """
         # Check correctness
-        assert sum(self.state[tsk] for tsk in TaskScope.concrete()) < self.n_servers
+        assert sum(self.state.values()) < self.n_servers
 
         # Generate completion
         server_idx = self.server_selector.select_idle()
         if server_idx is None:
             raise RuntimeError("Cannot find server for arrival of task {} at time {}".format(tsk, t_now))
         t_completion = self.servers[server_idx].submit_arrival(tsk, t_now)
+        e_completion = Event(EventType.of(ActionScope.COMPLETION, SystemScope.CLOUDLET, tsk), t_completion, t_arrival=t_now)
+        self.completions[server_idx] = e_completion
 
         # Update metrics
         self.metrics.counters.arrived[SystemScope.CLOUDLET][tsk] += 1
-        self.metrics.counters.population_area[SystemScope.CLOUDLET][tsk] += (t_now - self.t_last_event[tsk]) * self.state[tsk]
 
-        # Update state
-        self.state[tsk] += 1
+        # Update state and timing
+        self._update_population(tsk, t_now, 1)
 
-        # Update timing
-        self.t_last_event[tsk] = t_now
-
-        return t_completion
+        return e_completion
 
     def submit_interruption(self, tsk, t_now):
         """
         Submit the interruption of a task.
         :param tsk: (TaskType) the type of the task.
         :param t_now: (float) the current time.
-        :return: (c,w,s,r) where
-        *c* is the completion time to ignore;
+        :return: (c,a) where
+        *c* is the scheduled completion event to ignore;
         *a* is the arrival time;
-        *r* is the remaining service time ratio;
         """
         # Check correctness
         assert self.state[tsk] > 0
@@ -113,22 +113,20 @@ class SimpleCloudlet:
         server_idx = self.server_selector.select_interruption(tsk)
         if server_idx is None:
             raise RuntimeError("Cannot find server for interruption of task {} at time {}".format(tsk, t_now))
-        t_completion_to_ignore, t_arrival = self.servers[server_idx].submit_interruption(tsk, t_now)
+        _, t_arrival = self.servers[server_idx].submit_interruption(tsk, t_now)
+        e_completion_to_ignore = self.completions[server_idx]
+        self.completions[server_idx] = None
         t_served = t_now - t_arrival
 
         # Update metrics
         self.metrics.counters.switched[SystemScope.CLOUDLET][tsk] += 1
         self.metrics.counters.switched_service_lost[SystemScope.CLOUDLET][tsk] += t_served
         self.metrics.counters.service[SystemScope.CLOUDLET][tsk] += t_served
-        self.metrics.counters.population_area[SystemScope.CLOUDLET][tsk] += (t_now - self.t_last_event[tsk]) * self.state[tsk]
 
-        # Update state
-        self.state[tsk] -= 1
-
-        # Update timing
-        self.t_last_event[tsk] = t_now
+        # Update state and timing
+        self._update_population(tsk, t_now, -1)
 
-        return t_completion_to_ignore, t_arrival
+        return e_completion_to_ignore, t_arrival
 
     def submit_completion(self, tsk, t_now, t_arrival):
         """
@@ -146,29 +144,39 @@ class SimpleCloudlet:
         if server_idx is None:
             raise RuntimeError("Cannot find server for completion of task {} at time {}".format(tsk, t_now))
         self.servers[server_idx].submit_completion()
+        self.completions[server_idx] = None
         t_served = t_now - t_arrival
 
         # Update metrics
         self.metrics.counters.completed[SystemScope.CLOUDLET][tsk] += 1
         self.metrics.counters.service[SystemScope.CLOUDLET][tsk] += t_served
-        self.metrics.counters.population_area[SystemScope.CLOUDLET][tsk] += (t_now - self.t_last_event[tsk]) * self.state[tsk]
 
-        # Update state
-        self.state[tsk] -= 1
-
-        # Update timing
-        self.t_last_event[tsk] = t_now
+        # Update state and timing
+        self._update_population(tsk, t_now, -1)
 
     # ==================================================================================================================
     # OTHER
     # ==================================================================================================================
 
+    def _update_population(self, tsk, t_now, delta):
+        """
+        Updates the population area, the state and the timing for the given type of task.
+        :param tsk: (TaskType) the type of the task.
+        :param t_now: (float) the current time.
+        :param delta: (int) the population variation, e.g. +1 on arrival and -1 on departure.
+        :return: None
+        """
+        self._population_area[tsk] += (t_now - self.t_last_event[tsk]) * self.state[tsk]
+        self.state[tsk] += delta
+        self.t_last_event[tsk] = t_now
+
     def is_idle(self):
         """
         Check weather the Cloudlet is idle or not.
         :return: True, if the Cloudlet is idle; False, otherwise.
         """
-        return sum(self.state[tsk] for tsk in TaskScope.concrete()) == 0
+        # Notice that the state only holds concrete task scopes, whose populations are never negative.
+        return not any(self.state.values())
 
     def find_completion_server_idx(self, task_type, t_completion):
         """
@@ -1,6 +1,10 @@
-import copy
 import yaml
 
+try:
+    from yaml import CSafeLoader as _Loader  # the libyaml parser, if available
+except ImportError:
+    from yaml import SafeLoader as _Loader
+
 from core.simulation.model.scope import TaskScope
 from core.rnd.rndvar import Variate
 from core.simulation.model.server_selection import SelectionRule
@@ -8,93 +12,99 @@ from core.simulation.simulation_mode import SimulationMode
 from core.simulation.model.controller import ControllerAlgorithm
 
 
-_default_configuration = {
-
-    "general": {
-        #"mode": "PERFORMANCE_ANALYSIS",  # the simulation mode
+def _build_default_configuration():
+    """
+    Build a new instance of the default configuration.
+    Notice that the dictionary literal is built from scratch at every call, so that no copy is needed.
+    :return: a new instance of the default configuration.
+    """
+    return {
 
-        # Required for TRANSIENT_ANALYSIS
-        #"t_stop": 3600,  # the stop time for the simulation (s) 1hour=3600, 1day=86400, 1week=604800, 1month=2.628e+6
+        "general": {
+            #"mode": "PERFORMANCE_ANALYSIS",  # the simulation mode
 
-        # Required for PERFORMANCE_ANALYSIS
-        #"batches": 64,  # the number of batches
-        #"batchdim": 512,  # the batch dimension
-        "confidence": 0.95,  # the level of confidence
-        "rnd": {
-            "generator": "MarcianiMultiStream",  # the class name of the rnd generator
-            "seed": 123456789  # the initial seed for the rnd generator
-        }
-    },
+            # Required for TRANSIENT_ANALYSIS
+            #"t_stop": 3600,  # the stop time for the simulation (s) 1hour=3600, 1day=86400, 1week=604800, 1month=2.628e+6
 
-    "arrival": {
-        "TASK_1": {
-            "distribution": "EXPONENTIAL",
-            "parameters": {
-                "r": 4.00  # the arrival rate for tasks of type 1 (tasks/s)
+            # Required for PERFORMANCE_ANALYSIS
+            #"batches": 64,  # the number of batches
+            #"batchdim": 512,  # the batch dimension
+            "confidence": 0.95,  # the level of confidence
+            "rnd": {
+                "generator": "MarcianiMultiStream",  # the class name of the rnd generator
+                "seed": 123456789  # the initial seed for the rnd generator
             }
         },
-        "TASK_2": {
-            "distribution": "EXPONENTIAL",
-            "parameters": {
-                "r": 6.25  # the arrival rate for tasks of type 2 (tasks/s)
-            }
-        }
-    },
-
-    "system": {
-        "cloudlet": {
-            "n_servers": 20,  # the number of servers
-            "threshold": 20,  # the occupancy threshold
-            "server_selection": "ORDER",  # the server-selection rule
-            "controller_algorithm": "ALGORITHM_2",
-            "service": {
-                "TASK_1": {
-                    "distribution": "EXPONENTIAL",
-                    "parameters": {
-                        "r": 0.45  # the service rate for tasks of type 1 (tasks/s)
-                    }
-                },
-                "TASK_2": {
-                    "distribution": "EXPONENTIAL",
-                    "parameters": {
-                        "r": 0.27  # the service rate for tasks of type 2 (tasks/s)
-                    }
+
+        "arrival": {
+            "TASK_1": {
+                "distribution": "EXPONENTIAL",
+                "parameters": {
+                    "r": 4.00  # the arrival rate for tasks of type 1 (tasks/s)
+                }
+            },
+            "TASK_2": {
+                "distribution": "EXPONENTIAL",
+                "parameters": {
+                    "r": 6.25  # the arrival rate for tasks of type 2 (tasks/s)
                 }
             }
         },
 
-        "cloud": {
-            "service": {
-                "TASK_1": {
-                    "distribution": "EXPONENTIAL",
-                    "parameters": {
-                        "r": 0.25  # the service rate for tasks of type 1 (tasks/s)
-                    }
-                },
-                "TASK_2": {
-                    "distribution": "EXPONENTIAL",
-                    "parameters": {
-                        "r": 0.22  # the service rate for tasks of type 2 (tasks/s)
+        "system": {
+            "cloudlet": {
+                "n_servers": 20,  # the number of servers
+                "threshold": 20,  # the occupancy threshold
+                "server_selection": "ORDER",  # the server-selection rule
+                "controller_algorithm": "ALGORITHM_2",
+                "service": {
+                    "TASK_1": {
+                        "distribution": "EXPONENTIAL",
+                        "parameters": {
+                            "r": 0.45  # the service rate for tasks of type 1 (tasks/s)
+                        }
+                    },
+                    "TASK_2": {
+                        "distribution": "EXPONENTIAL",
+                        "parameters": {
+                            "r": 0.27  # the service rate for tasks of type 2 (tasks/s)
+                        }
                     }
                 }
             },
-            "setup": {
-                "TASK_1": {
-                    "distribution": "DETERMINISTIC",
-                    "parameters": {
-                        "v": 0  # the value of the setup time to restart a task of type 1 in the Cloud (s).
+
+            "cloud": {
+                "service": {
+                    "TASK_1": {
+                        "distribution": "EXPONENTIAL",
+                        "parameters": {
+                            "r": 0.25  # the service rate for tasks of type 1 (tasks/s)
+                        }
+                    },
+                    "TASK_2": {
+                        "distribution": "EXPONENTIAL",
+                        "parameters": {
+                            "r": 0.22  # the service rate for tasks of type 2 (tasks/s)
+                        }
                     }
                 },
-                "TASK_2": {
-                    "distribution": "EXPONENTIAL",
-                    "parameters": {
-                        "m": 0.8  # the mean value of the setup time to restart a task 2 in the Cloud (s).
+                "setup": {
+                    "TASK_1": {
+                        "distribution": "DETERMINISTIC",
+                        "parameters": {
+                            "v": 0  # the value of the setup time to restart a task of type 1 in the Cloud (s).
+                        }
+                    },
+                    "TASK_2": {
+                        "distribution": "EXPONENTIAL",
+                        "parameters": {
+                            "m": 0.8  # the mean value of the setup time to restart a task 2 in the Cloud (s).
+                        }
                     }
                 }
             }
         }
     }
-}
 
 
 def get_default_configuration(simulation_mode=SimulationMode.PERFORMANCE_ANALYSIS):
@@ -103,7 +113,7 @@ def get_default_configuration(simulation_mode=SimulationMode.PERFORMANCE_ANALYSI
     :param simulation_mode (SimulationMode) the simulation mode of execution.
     :return: a copy of default configuration.
     """
-    config = copy.deepcopy(_default_configuration)
+    config = _build_default_configuration()
 
     # Add configuration specific to transient analysis
     if simulation_mode is SimulationMode.TRANSIENT_ANALYSIS:
@@ -130,7 +140,7 @@ def load_configuration(filename, norm=True):
     :return: (Configuration) the configuration.
     """
     with open(filename, "r") as config_file:
-        config = yaml.load(config_file, Loader=yaml.FullLoader)
+        config = yaml.load(config_file, Loader=_Loader)
     if norm:
         normalize(config)
     return config
@@ -143,14 +153,24 @@ def normalize(config):
     :return: None
     """
     config["general"]["mode"] = SimulationMode[config["general"]["mode"]]
-    _normalize_random_config(config["arrival"])
-    _normalize_random_config(config["system"]["cloudlet"]["service"])
-    _normalize_random_config(config["system"]["cloud"]["service"])
-    _normalize_random_config(config["system"]["cloud"]["setup"])
+    for entry in _iter_random_configs(config):
+        _normalize_random_config(entry)
     config["system"]["cloudlet"]["server_selection"] = SelectionRule[config["system"]["cloudlet"]["server_selection"]]
     config["system"]["cloudlet"]["controller_algorithm"] = ControllerAlgorithm[config["system"]["cloudlet"]["controller_algorithm"]]
 
 
+def _iter_random_configs(config):
+    """
+    Iterate over the rnd entries of the configuration.
+    :param config: the configuration.
+    :return: a generator of the rnd entries, i.e. arrival, cloudlet service, cloud service and cloud setup.
+    """
+    yield config["arrival"]
+    yield config["system"]["cloudlet"]["service"]
+    yield config["system"]["cloud"]["service"]
+    yield config["system"]["cloud"]["setup"]
+
+
 def _normalize_random_config(entry):
     """
     Normalize the rnd entry.
@@ -159,10 +179,11 @@ def _normalize_random_config(entry):
     """
     for tsk in list(entry):
         if isinstance(tsk, TaskScope): continue
-        entry[tsk]["distribution"] = Variate[entry[tsk]["distribution"]]
-        if entry[tsk]["distribution"] is Variate.EXPONENTIAL and "r" in entry[tsk]["parameters"]:
-            entry[tsk]["parameters"]["m"] = 1.0 / entry[tsk]["parameters"]["r"]
-            del entry[tsk]["parameters"]["r"]
+        variate = entry[tsk]
+        variate["distribution"] = Variate[variate["distribution"]]
+        parameters = variate["parameters"]
+        if variate["distribution"] is Variate.EXPONENTIAL and "r" in parameters:
+            parameters["m"] = 1.0 / parameters.pop("r")
         entry[TaskScope[tsk]] = entry.pop(tsk)
 
 
@@ -34,9 +34,8 @@ class ControllerAlgorithm1(SimpleController):
         self.cloudlet_n_servers = cloudlet_n_servers
 
     def process(self, tsk):
-        n1 = self.cloudlet_state[TaskScope.TASK_1]
-        n2 = self.cloudlet_state[TaskScope.TASK_2]
-        if n1 + n2 == self.cloudlet_n_servers:
+        state = self.cloudlet_state
+        if state[TaskScope.TASK_1] + state[TaskScope.TASK_2] == self.cloudlet_n_servers:
             return ControllerResponse.SUBMIT_TO_CLOUD
         else:
             return ControllerResponse.SUBMIT_TO_CLOUDLET
@@ -54,15 +53,17 @@ class ControllerAlgorithm2(SimpleController):
         self.cloudlet_threshold = cloudlet_threshold
 
     def process(self, tsk):
-        n1 = self.cloudlet_state[TaskScope.TASK_1]
-        n2 = self.cloudlet_state[TaskScope.TASK_2]
+        state = self.cloudlet_state
+        n1 = state[TaskScope.TASK_1]
+        n2 = state[TaskScope.TASK_2]
+        n = n1 + n2
 
         if tsk is TaskScope.TASK_1:
 
             if n1 == self.cloudlet_n_servers:
                 return ControllerResponse.SUBMIT_TO_CLOUD
 
-            elif n1 + n2 < self.cloudlet_threshold:
+            elif n < self.cloudlet_threshold:
                 return ControllerResponse.SUBMIT_TO_CLOUDLET
 
             elif n2 > 0:
@@ -72,7 +73,7 @@ class ControllerAlgorithm2(SimpleController):
                 return ControllerResponse.SUBMIT_TO_CLOUDLET
 
         elif tsk is TaskScope.TASK_2:
-            if n1 + n2 >= self.cloudlet_threshold:
+            if n >= self.cloudlet_threshold:
                 return ControllerResponse.SUBMIT_TO_CLOUD
 
             else:
@@ -86,15 +86,14 @@ class SimpleEvent:
         self.type = type
         self.time = time
         self.meta = SimpleNamespace(**kwargs)
+        self.active = True  # False, if the event has been unscheduled
 
     def __str__(self):
         """
         String representation.
         :return: the string representation.
         """
-        sb = ["{attr}={value}".format(attr=attr, value=self.__dict__[attr]) for attr in self.__dict__ if
-              not attr.startswith("__") and not callable(getattr(self, attr))]
-        return "Event({})".format(", ".join(sb))
+        return "Event(type={}, time={}, meta={}, active={})".format(self.type, self.time, self.meta, self.active)
 
     def __repr__(self):
         """
@@ -38,9 +38,14 @@ class SimpleServer:
         self.idx = idx
 
         # Randomization
-        self.rndservice = deepcopy(rndservice)
-        for tsk in self.rndservice.str:
-            self.rndservice.str[tsk] += self.idx  # decoupling of each server randomness
+        # Notice that only the generator is copied: variates and parameters are read-only configuration,
+        # hence they are shared among servers instead of being deep-copied.
+        self.rndservice = RandomComponent(
+            gen=deepcopy(rndservice.gen),
+            str={tsk: rndservice.str[tsk] + self.idx for tsk in rndservice.str},  # decoupling of each server randomness
+            var=rndservice.var,
+            par=rndservice.par
+        )
 
         # State and important variables
         self.state = ServerState.IDLE  # the state of the server (ServerState)
@@ -6,10 +6,12 @@ from core.simulation.model.scope import SystemScope
 from core.simulation.model.scope import TaskScope
 from core.simulation.model.scope import ActionScope
 from core.utils.logutils import get_logger
+import logging
 
 
 # Logging
 logger = get_logger(__name__)
+DEBUG = logging.DEBUG
 
 
 class SimpleCloudletCloudSystem:
@@ -17,6 +19,8 @@ class SimpleCloudletCloudSystem:
     A system composed by a Cloudlet and a Cloud.
     """
 
+    __slots__ = ("state", "metrics", "cloudlet", "cloud")
+
     def __init__(self, rndgen, config, metrics):
         """
         Create a new system.
@@ -63,29 +67,23 @@ class SimpleCloudletCloudSystem:
         *s* is a list of events to schedule;
         *u* is a list of events to unschedule.
         """
-        response_events_to_schedule = []
-        response_events_to_unschedule = []
+        # Notice that the lists returned by the submission are passed through, rather than copied.
+        event_type = event.type
 
-        if event.type.act is ActionScope.ARRIVAL:
+        if event_type.act is ActionScope.ARRIVAL:
 
             # Submit the arrival
-            e_completions_to_schedule, e_completions_to_unschedule = self.submit_arrival(event.type.tsk, event.time)
-
-            # Add completions to schedule
-            response_events_to_schedule.extend(e_completions_to_schedule)
-
-            # Add completions to unschedule
-            response_events_to_unschedule.extend(e_completions_to_unschedule)
+            return self.submit_arrival(event_type.tsk, event.time)
 
-        elif event.type.act is ActionScope.COMPLETION:
+        elif event_type.act is ActionScope.COMPLETION:
 
             # Submit the completion
-            self.submit_completion(event.type.tsk, event.type.sys, event.time, event.meta)
+            self.submit_completion(event_type.tsk, event_type.sys, event.time, event.meta)
+            return [], []
+
         else:
             raise ValueError("Unrecognized event: {}".format(event))
 
-        return response_events_to_schedule, response_events_to_unschedule
-
     def submit_arrival(self, tsk, t_now):
         """
         Submit the arrival of a task.
@@ -95,100 +93,50 @@ class SimpleCloudletCloudSystem:
         *s* is a list of events to schedule;
         *u* is a list of events to unschedule;
         """
+        cloudlet = self.cloudlet
+        cloud = self.cloud
+        debug = logger.isEnabledFor(DEBUG)
+
         e_to_schedule = []
         e_to_unschedule = []
 
         # Process arrival
-        controller_response = self.cloudlet.controller.process(tsk)
+        # Notice that every response submits the arriving task, whose completion is scheduled once, after the dispatch.
+        controller_response = cloudlet.controller.process(tsk)
 
         if controller_response is ControllerResponse.SUBMIT_TO_CLOUDLET:
-            logger.debug("{} sent to CLOUDLET at {}".format(tsk, t_now))
-            t_completion = self.cloudlet.submit_arrival(tsk, t_now)
-            e_completion = Event(EventType.of(ActionScope.COMPLETION, SystemScope.CLOUDLET, tsk), t_completion, t_arrival=t_now)
-            e_to_schedule.append(e_completion)
+            if debug:
+                logger.debug("%s sent to CLOUDLET at %s", tsk, t_now)
+            e_completion = cloudlet.submit_arrival(tsk, t_now)
 
         elif controller_response is ControllerResponse.SUBMIT_TO_CLOUD:
-            logger.debug("{} sent to CLOUD at {}".format(tsk, t_now))
-            t_completion = self.cloud.submit_arrival(tsk, t_now)
+            if debug:
+                logger.debug("%s sent to CLOUD at %s", tsk, t_now)
+            t_completion = cloud.submit_arrival(tsk, t_now)
             e_completion = Event(EventType.of(ActionScope.COMPLETION, SystemScope.CLOUD, tsk), t_completion, t_arrival=t_now)
-            e_to_schedule.append(e_completion)
 
         elif controller_response is ControllerResponse.SUBMIT_TO_CLOUDLET_WITH_INTERRUPTION:
             tsk_interrupt = TaskScope.TASK_2
-            logger.debug("{} interrupted in CLOUDLET at {}".format(tsk_interrupt, t_now))
-            t_completion_1, t_arrival_1 = self.cloudlet.submit_interruption(tsk_interrupt, t_now)
-            e_completion_to_ignore = Event(EventType.of(ActionScope.COMPLETION, SystemScope.CLOUDLET, tsk_interrupt),t_completion_1)
+            if debug:
+                logger.debug("%s interrupted in CLOUDLET at %s", tsk_interrupt, t_now)
+            e_completion_to_ignore, t_arrival_1 = cloudlet.submit_interruption(tsk_interrupt, t_now)
             e_to_unschedule.append(e_completion_to_ignore)
 
-            logger.debug("{} restarted in CLOUD at {}".format(tsk_interrupt, t_now))
-            t_completion = self.cloud.submit_arrival(tsk_interrupt, t_now, restart=True)
+            if debug:
+                logger.debug("%s restarted in CLOUD at %s", tsk_interrupt, t_now)
+            t_completion = cloud.submit_arrival(tsk_interrupt, t_now, restart=True)
             # TODO check t_arrival=t_arrival_1 or t_now
-            e_completion = Event(EventType.of(ActionScope.COMPLETION, SystemScope.CLOUD, tsk_interrupt), t_completion, t_arrival=t_now, switched=True)
-            e_to_schedule.append(e_completion)
+            e_completion_restart = Event(EventType.of(ActionScope.COMPLETION, SystemScope.CLOUD, tsk_interrupt), t_completion, t_arrival=t_now, switched=True)
+            e_to_schedule.append(e_completion_restart)
 
-            logger.debug("{} sent to CLOUDLET at {}".format(tsk, t_now))
-            t_completion = self.cloudlet.submit_arrival(tsk, t_now)
-            e_completion = Event(EventType.of(ActionScope.COMPLETION, SystemScope.CLOUDLET, tsk), t_completion, t_arrival=t_now)
-            e_to_schedule.append(e_completion)
+            if debug:
+                logger.debug("%s sent to CLOUDLET at %s", tsk, t_now)
+            e_completion = cloudlet.submit_arrival(tsk, t_now)
 
         else:
             raise ValueError("Unrecognized controller response {}".format(controller_response))
 
-        """
-        if tsk is TaskScope.TASK_1:
-
-            if self.state[SystemScope.CLOUDLET][TaskScope.TASK_1] == self.cloudlet.n_servers:
-                logger.debug("{} sent to CLOUD at {}".format(tsk, t_now))
-                t_completion = self.cloud.submit_arrival(tsk, t_now)
-                e_completion = Event(EventType.of(ActionScope.COMPLETION, SystemScope.CLOUD, tsk), t_completion, t_arrival=t_now)
-                e_to_schedule.append(e_completion)
-
-            elif self.state[SystemScope.CLOUDLET][TaskScope.TASK_1] + self.state[SystemScope.CLOUDLET][TaskScope.TASK_2] < self.cloudlet.threshold:
-                logger.debug("{} sent to CLOUDLET at {}".format(tsk, t_now))
-                t_completion = self.cloudlet.submit_arrival(tsk, t_now)
-                e_completion = Event(EventType.of(ActionScope.COMPLETION, SystemScope.CLOUDLET, tsk), t_completion, t_arrival=t_now)
-                e_to_schedule.append(e_completion)
-
-            elif self.state[SystemScope.CLOUDLET][TaskScope.TASK_2] > 0:
-                tsk_interrupt = TaskScope.TASK_2
-                logger.debug("{} interrupted in CLOUDLET at {}".format(tsk_interrupt, t_now))
-                t_completion_1, t_arrival_1 = self.cloudlet.submit_interruption(tsk_interrupt, t_now)
-                e_completion_to_ignore = Event(EventType.of(ActionScope.COMPLETION, SystemScope.CLOUDLET, tsk_interrupt), t_completion_1)
-                e_to_unschedule.append(e_completion_to_ignore)
-
-                logger.debug("{} restarted in CLOUD at {}".format(tsk_interrupt, t_now))
-                t_completion = self.cloud.submit_arrival(tsk_interrupt, t_now, restart=True)
-                # TODO check t_arrival=t_arrival_1 or t_now
-                e_completion = Event(EventType.of(ActionScope.COMPLETION, SystemScope.CLOUD, tsk_interrupt), t_completion, t_arrival=t_now, switched=True)
-                e_to_schedule.append(e_completion)
-
-                logger.debug("{} sent to CLOUDLET at {}".format(tsk, t_now))
-                t_completion = self.cloudlet.submit_arrival(tsk, t_now)
-                e_completion = Event(EventType.of(ActionScope.COMPLETION, SystemScope.CLOUDLET, tsk), t_completion, t_arrival=t_now)
-                e_to_schedule.append(e_completion)
-
-            else:
-                logger.debug("{} sent to CLOUDLET at {}".format(tsk, t_now))
-                t_completion = self.cloudlet.submit_arrival(tsk, t_now)
-                e_completion = Event(EventType.of(ActionScope.COMPLETION, SystemScope.CLOUDLET, tsk), t_completion, t_arrival=t_now)
-                e_to_schedule.append(e_completion)
-
-        elif tsk is TaskScope.TASK_2:
-            if self.state[SystemScope.CLOUDLET][TaskScope.TASK_1] + self.state[SystemScope.CLOUDLET][TaskScope.TASK_2] >= self.cloudlet.threshold:
-                logger.debug("{} sent to CLOUD at {}".format(tsk, t_now))
-                t_completion = self.cloud.submit_arrival(tsk, t_now)
-                e_completion = Event(EventType.of(ActionScope.COMPLETION, SystemScope.CLOUD, tsk), t_completion, t_arrival=t_now)
-                e_to_schedule.append(e_completion)
-
-            else:
-                logger.debug("{} sent to CLOUDLET at {}".format(tsk, t_now))
-                t_completion = self.cloudlet.submit_arrival(tsk, t_now)
-                e_completion = Event(EventType.of(ActionScope.COMPLETION, SystemScope.CLOUDLET, tsk), t_completion, t_arrival=t_now)
-                e_to_schedule.append(e_completion)
-
-        else:
-            raise ValueError("Unrecognized task type {}".format(tsk))
-        """
+        e_to_schedule.append(e_completion)
 
         return e_to_schedule, e_to_unschedule
 
@@ -201,7 +149,8 @@ class SimpleCloudletCloudSystem:
         :param meta: (dict) metadata associate to the completion event.
         :return: None
         """
-        logger.debug("{} completed in {} at {}".format(tsk, scope, t_now))
+        if logger.isEnabledFor(DEBUG):
+            logger.debug("%s completed in %s at %s", tsk, scope, t_now)
 
         # Check correctness
         assert self.state[scope][tsk] > 0
@@ -231,6 +180,5 @@ class SimpleCloudletCloudSystem:
         String representation.
         :return: the string representation.
         """
-        sb = ["{attr}={value}".format(attr=attr, value=self.__dict__[attr]) for attr in self.__dict__ if
-              not attr.startswith("__") and not callable(getattr(self, attr))]
+        sb = ["{attr}={value}".format(attr=attr, value=getattr(self, attr)) for attr in self.__slots__]
         return "System({}:{})".format(id(self), ", ".join(sb))
@@ -3,7 +3,7 @@ from core.simulation.model.event import EventType
 from core.simulation.model.scope import SystemScope
 from core.simulation.model.scope import ActionScope
 from core.simulation.model.scope import TaskScope
-from core.rnd.rndvar import exponential
+from math import log
 from core.utils.logutils import get_logger
 
 
@@ -22,20 +22,27 @@ class ExponentialTaskgen:
         :param rndgen: (object) the multi-stream rnd number generator.
         :param config: (dict) the arrival rates configuration.
         """
+        tasks = TaskScope.concrete()
+        arrivals = {tsk: EventType.of(ActionScope.ARRIVAL, SystemScope.SYSTEM, tsk) for tsk in TaskScope}
+
         # Arrival rates
-        self.rates = {tsk: 1.0 / config[tsk]["parameters"]["m"] for tsk in TaskScope.concrete()}
+        self.rates = {tsk: 1.0 / config[tsk]["parameters"]["m"] for tsk in tasks}
 
         # Randomization
         self.rndgen = rndgen
-        self.stream = {tsk: EventType.of(ActionScope.ARRIVAL, SystemScope.SYSTEM, tsk).value for tsk in TaskScope}
-        self.lambda_tot = sum(self.rates[tsk] for tsk in TaskScope.concrete())
+        self.stream = {tsk: arrivals[tsk].value for tsk in TaskScope}
+        self.lambda_tot = sum(self.rates[tsk] for tsk in tasks)
         self.p_1 = self.rates[TaskScope.TASK_1] / self.lambda_tot
 
         # Events
-        self.event_types = {tsk: EventType.of(ActionScope.ARRIVAL, SystemScope.SYSTEM, tsk) for tsk in TaskScope.concrete()}
+        self.event_types = {tsk: arrivals[tsk] for tsk in tasks}
 
         # State
-        self.generated = {tsk: 0 for tsk in TaskScope.concrete()}
+        self.generated = {tsk: 0 for tsk in tasks}
+
+        # Hot-path constants, used by generate()
+        self._stream_global = self.stream[TaskScope.GLOBAL]
+        self._neg_m_tot = -1.0 / self.lambda_tot  # the negated mean inter-arrival time
 
     def generate(self, t_clock):
         """
@@ -44,12 +51,13 @@ class ExponentialTaskgen:
         :param tsk: (TaskType) the type of the task. Default: None
         :return: (SimpleEvent) a new rnd arrival.
         """
+        rnd_stream = self.rndgen.rnd_stream
+
         # Select the type of arrival and the corresponding arrival time
-        self.rndgen.stream(self.stream[TaskScope.GLOBAL])
-        u = self.rndgen.rnd()
+        u = rnd_stream(self._stream_global)
         tsk = TaskScope.TASK_1 if u <= self.p_1 else TaskScope.TASK_2
-        self.rndgen.stream(self.stream[tsk])
-        t_event = t_clock + exponential(m=(1.0 / self.lambda_tot), u=self.rndgen.rnd())
+        # Notice that the exponential variate -m*log(1-u) is inlined
+        t_event = t_clock + self._neg_m_tot * log(1.0 - rnd_stream(self.stream[tsk]))
 
         # Generate the arrival event
         arrival = Event(self.event_types[tsk], t_event)
@@ -68,9 +76,7 @@ class ExponentialTaskgen:
         String representation.
         :return: the string representation.
         """
-        sb = ["{attr}={value}".format(attr=attr, value=self.__dict__[attr]) for attr in self.__dict__ if
-              not attr.startswith("__") and not callable(getattr(self, attr))]
-        return "Taskgen({}:{})".format(id(self), ", ".join(sb))
+        return "Taskgen({}:rates={}, generated={})".format(id(self), self.rates, self.generated)
 
 
 if __name__ == "__main__":
@@ -9,7 +9,8 @@ from core.simulation.model.calendar import NextEventCalendar as Calendar
 from core.simulation.model.event import ActionScope
 from core.utils.guiutils import print_progress
 from core.metrics.simulation_metrics import SimulationMetrics
-from core.utils.file_utils import empty_file
+from core.utils.file_utils import create_dir_tree
+from core.utils.csv_utils import str_csv
 from core.simulation.simulation_mode import SimulationMode
 from core.simulation.model.controller import ControllerAlgorithm
 from math import floor
@@ -17,6 +18,17 @@ from math import floor
 from sys import maxsize as INFINITE
 import os
 
+DEFAULT_SAMPLING_BUFFER = 1024  # the number of samples buffered before being written to the sampling file
+
+# Scopes, computed once
+_CONCRETE_TASKS = tuple(TaskScope.concrete())
+_SORTED_SYSTEMS = tuple(sorted(SystemScope, key=lambda x: x.name))
+_SORTED_TASKS = tuple(sorted(TaskScope, key=lambda x: x.name))
+
+# Actions, bound once for identity comparisons in the simulation loop
+_ARRIVAL = ActionScope.ARRIVAL
+_COMPLETION = ActionScope.COMPLETION
+
 
 # Logging
 #logger = get_logger(__name__)
@@ -44,9 +56,8 @@ class Simulation:
             #self.t_tran = 0
             self.batches = INFINITE
             self.batchdim = 1
-            self.closed_door_condition = lambda: self.closed_door_condition_transient_analysis()
-            self.print_progress = lambda: print_progress(self.calendar.get_clock(), self.t_stop,
-                                                         message="Clock: %d" % (self.calendar.get_clock()))
+            self.closed_door_condition = self.closed_door_condition_transient_analysis
+            self.print_progress = self.print_progress_transient_analysis
             #self.should_discard_transient_data = False
 
         # Configuration - Performance Analysis
@@ -55,10 +66,8 @@ class Simulation:
             #self.t_tran = config_general["t_tran"]
             self.batches = config_general["batches"]
             self.batchdim = config_general["batchdim"]
-            self.closed_door_condition = lambda: self.closed_door_condition_performance_analysis()
-            self.print_progress = lambda: print_progress(self.metrics.n_batches, self.batches,
-                                                         message="Clock: %d | Batches: %d | CurrentBatchSamples: %d" %
-                                                                 (self.calendar.get_clock(), self.metrics.n_batches, self.metrics.curr_batchdim))
+            self.closed_door_condition = self.closed_door_condition_performance_analysis
+            self.print_progress = self.print_progress_performance_analysis
             #self.should_discard_transient_data = self.t_tran > 0.0
 
         else:
@@ -73,7 +82,7 @@ class Simulation:
 
         # Configuration - Tasks
         # Checks that the arrival process is Markovian (currently, the only one supported)
-        if not all(variate is Variate.EXPONENTIAL for variate in [config["arrival"][tsk]["distribution"] for tsk in TaskScope.concrete()]):
+        if not all(variate is Variate.EXPONENTIAL for variate in [config["arrival"][tsk]["distribution"] for tsk in _CONCRETE_TASKS]):
             raise NotImplementedError("The current version supports only exponential arrivals")
         self.taskgen = Taskgen(rndgen=self.rndgen, config=config["arrival"])
 
@@ -91,7 +100,12 @@ class Simulation:
         self.calendar = Calendar(t_clock=0.0)
 
         # Sampling management
+        # Notice that samples are buffered as CSV rows, and written to the sampling file every *sampling_buffer* samples.
         self.sampling_file = None
+        self.sampling_buffer = config_general.get("sampling_buffer", DEFAULT_SAMPLING_BUFFER)
+        self._sampling_fd = None
+        self._sampling_header = False  # True, if the CSV header has been written to the sampling file
+        self._sampling_rows = []
 
         # Simulation management
         self.closed_door = False
@@ -109,86 +123,149 @@ class Simulation:
         :return: None
         """
 
+        # Notice that the simulation components are bound to locals, for the sake of performance.
+        # Notice that the mode-specific conditions and progress are bound once, at initialization, so the loop
+        # never branches on the simulation mode.
+        calendar = self.calendar
+        system = self.system
+        metrics = self.metrics
+        taskgen = self.taskgen
+        schedule_many = calendar.schedule_many
+        unschedule_many = calendar.unschedule_many
+        is_idle = system.is_idle
+        closed_door_condition = self.closed_door_condition
+        print_progress = self.print_progress
+        closed_door = self.closed_door
+
         # Initialize sampling
+        # Notice that the sampling file is kept open for the whole simulation, and buffered samples are always
+        # flushed and the file closed, even if the simulation fails.
         self.sampling_file = os.path.join(outdir, "result.sampling.csv")
-        empty_file(self.sampling_file)
-
-        # Initialize first arrivals
-        # Schedule the first events, i.e. task of type 1 and 2.
-        # Notice that the event order by arrival time is managed internally by the Calendar.
-        self.calendar.schedule(self.taskgen.generate(self.calendar.get_clock()))
-
-        # Run the simulation until the stop condition holds true
-        while not self.stop_condition():
-
-            # Get the next event and update the calendar clock.
-            # Notice that the Calendar clock is automatically updated.
-            # Notice that the next event is always a possible event.
-            event = self.calendar.get_next_event()
-
-            # Check the closed-door condition
-            self.closed_door = self.closed_door_condition()
-
-            # Submit the event to the system if:
-            #   * the closed door condition is False
-            #   * the closed door condition is True, but the event is not an ARRIVAL
-            # Notice that every submission generates some other events to be scheduled/unscheduled,
-            # e.g., completions and interruptions (i.e., completions to be ignored).
-            if self.closed_door is False or event.type.act is not ActionScope.ARRIVAL:
-                events_to_schedule, events_to_unschedule = self.system.submit(event)
-                # Schedule/Unschedule response events
-                self.calendar.schedule(*events_to_schedule)
-                self.calendar.unschedule(*events_to_unschedule)
-
-            # If the last event was an arrival and the closed-door condition does not hold, schedule a new arrival
-            # Notice that, impossible events are automatically ignored by the calendar
-            if event.type.act is ActionScope.ARRIVAL and self.closed_door is False:
-                self.calendar.schedule(self.taskgen.generate(self.calendar.get_clock()))
-
-            # Sampling
-            if self.sampling_condition(event):
-                sample = self.metrics.sampling(self.calendar.get_clock())
-                sample.save_csv(self.sampling_file, append=True)
-
-            # Simulation progress
-            if show_progress:
-                self.print_progress()
+        create_dir_tree(self.sampling_file)
+        self._sampling_header = False
+        with open(self.sampling_file, "w") as sampling_fd:
+            self._sampling_fd = sampling_fd
+            try:
+                # Initialize first arrivals
+                # Schedule the first events, i.e. task of type 1 and 2.
+                # Notice that the event order by arrival time is managed internally by the Calendar.
+                calendar.schedule(taskgen.generate(calendar.get_clock()))
+
+                # Run the simulation until the stop condition holds true
+                # Stop condition: the closed-door condition holds true and the system is idle.
+                while not (closed_door and is_idle()):
+
+                    # Get the next event and update the calendar clock.
+                    # Notice that the Calendar clock is automatically updated.
+                    # Notice that the next event is always a possible event.
+                    event = calendar.get_next_event()
+                    clock = calendar.get_clock()
+                    act = event.type.act
+                    is_arrival = act is _ARRIVAL
+
+                    # Check the closed-door condition
+                    closed_door = closed_door_condition(clock)
+
+                    # Submit the event to the system if:
+                    #   * the closed door condition is False
+                    #   * the closed door condition is True, but the event is not an ARRIVAL
+                    # Notice that every submission generates some other events to be scheduled/unscheduled,
+                    # e.g., completions and interruptions (i.e., completions to be ignored).
+                    if closed_door is False or not is_arrival:
+                        events_to_schedule, events_to_unschedule = system.submit(event)
+                        # Schedule/Unschedule response events, if any
+                        if events_to_schedule:
+                            schedule_many(events_to_schedule)
+                        if events_to_unschedule:
+                            unschedule_many(events_to_unschedule)
+
+                    # If the last event was an arrival and the closed-door condition does not hold, schedule a new arrival
+                    # Notice that, impossible events are automatically ignored by the calendar
+                    if is_arrival and closed_door is False:
+                        calendar.schedule(taskgen.generate(clock))
+
+                    # Sampling
+                    # Notice that the sampling condition holds true on completion events.
+                    if act is _COMPLETION:
+                        sample = metrics.sampling(clock)
+                        self._buffer_sample(sample)
+
+                    # Simulation progress
+                    if show_progress:
+                        print_progress(clock)
+            finally:
+                self.closed_door = closed_door
+                self._flush_samples()
+                self._sampling_fd = None
 
     # ==================================================================================================================
-    # CONDITIONS
+    # SAMPLING
     # ==================================================================================================================
 
-    def stop_condition(self):
+    def _buffer_sample(self, sample):
         """
-        Checks whether the stop condition holds true.
-        The stop condition holds true when the closed door condition hilds true and the system is idle.
-        :return: true, if the stop condition holds; false, otherwise.
+        Buffers a sample, flushing the buffer to the sampling file when it is full.
+        :param sample: (Sample) the sample.
+        :return: None
         """
-        return self.closed_door and self.system.is_idle()
+        if not self._sampling_header:
+            self._sampling_fd.write(",".join(map(str_csv, sample.get_csv_header())) + "\n")
+            self._sampling_header = True
+        self._sampling_rows.append(",".join(map(str, sample.get_csv_row())) + "\n")
+        if len(self._sampling_rows) >= self.sampling_buffer:
+            self._flush_samples()
+
+    def _flush_samples(self):
+        """
+        Writes the buffered samples to the sampling file, and empties the buffer.
+        :return: None
+        """
+        self._sampling_fd.writelines(self._sampling_rows)
+        self._sampling_rows.clear()
 
-    def closed_door_condition_performance_analysis(self):
+    # ==================================================================================================================
+    # CONDITIONS
+    # ==================================================================================================================
+
+    def closed_door_condition_performance_analysis(self, clock):
         """
         Checks whether the closed door condition holds true (PERFORMANCE_ANALYSIS).
         The closed door condition holds true if the desired number of batches have been collected
+        :param clock: (float) the current time.
         :return: true, if the closed door condition holds; false, otherwise.
         """
         return self.metrics.n_batches >= self.batches
 
-    def closed_door_condition_transient_analysis(self):
+    def closed_door_condition_transient_analysis(self, clock):
         """
         Checks whether the closed door condition holds true (TRANSIENT_ANALYSIS).
         The closed door condition holds true if the clock time passed the stop time.
+        :param clock: (float) the current time.
         :return: true, if the closed door condition holds; false, otherwise.
         """
-        return self.calendar.get_clock() >= self.t_stop
+        return clock >= self.t_stop
+
+    # ==================================================================================================================
+    # PROGRESS
+    # ==================================================================================================================
+
+    def print_progress_performance_analysis(self, clock):
+        """
+        Prints the simulation progress (PERFORMANCE_ANALYSIS), i.e. the number of collected batches.
+        :param clock: (float) the current time.
+        :return: None
+        """
+        print_progress(self.metrics.n_batches, self.batches,
+                       message="Clock: %d | Batches: %d | CurrentBatchSamples: %d" %
+                               (clock, self.metrics.n_batches, self.metrics.curr_batchdim))
 
-    def sampling_condition(self, event):
+    def print_progress_transient_analysis(self, clock):
         """
-        Checks whether the sampling condition holds true.
-        The sampling condition holds true on completion events.
-        :return: true, if the sampling condition holds; false, otherwise.
+        Prints the simulation progress (TRANSIENT_ANALYSIS), i.e. the clock time w.r.t. the stop time.
+        :param clock: (float) the current time.
+        :return: None
         """
-        return event.type.act is ActionScope.COMPLETION
+        print_progress(clock, self.t_stop, message="Clock: %d" % clock)
 
     # ==================================================================================================================
     # REPORT
@@ -222,10 +299,10 @@ class Simulation:
         r.add("randomization", "streams", self.rndgen.get_nstreams())
 
         # Report - Arrivals
-        for tsk in TaskScope.concrete():
+        for tsk in _CONCRETE_TASKS:
             r.add("arrival", "arrival_{}_dist".format(tsk.name.lower()), Variate.EXPONENTIAL.name)
             r.add("arrival", "arrival_{}_rate".format(tsk.name.lower()), self.taskgen.rates[tsk])
-        for tsk in TaskScope.concrete():
+        for tsk in _CONCRETE_TASKS:
             r.add("arrival", "generated_{}".format(tsk.name.lower()), self.taskgen.generated[tsk])
 
         # Report - System/Cloudlet
@@ -233,7 +310,7 @@ class Simulation:
         r.add("system/cloudlet", "controller_algorithm", self.system.cloudlet.controller.controller_algorithm.name)
         if self.system.cloudlet.controller.controller_algorithm is ControllerAlgorithm.ALGORITHM_2:
             r.add("system/cloudlet", "threshold", self.system.cloudlet.threshold)
-        for tsk in TaskScope.concrete():
+        for tsk in _CONCRETE_TASKS:
             r.add("system/cloudlet", "service_{}_dist".format(tsk.name.lower()), self.system.cloudlet.rndservice.var[tsk].name)
             if self.system.cloudlet.rndservice.var[tsk] is Variate.EXPONENTIAL:
                 r.add("system/cloudlet", "service_{}_rate".format(tsk.name.lower()), 1.0/self.system.cloudlet.rndservice.par[tsk]["m"])
@@ -242,7 +319,7 @@ class Simulation:
                     r.add("system/cloudlet", "service_{}_param_{}".format(tsk.name.lower(), p), self.system.cloudlet.rndservice.par[tsk][p])
 
         # Report - System/Cloud
-        for tsk in TaskScope.concrete():
+        for tsk in _CONCRETE_TASKS:
             r.add("system/cloud", "service_{}_dist".format(tsk.name.lower()), self.system.cloud.rndservice.var[tsk].name)
             if self.system.cloud.rndservice.var[tsk] is Variate.EXPONENTIAL:
                 r.add("system/cloud", "service_{}_rate".format(tsk.name.lower()), 1.0/self.system.cloud.rndservice.par[tsk]["m"])
@@ -250,7 +327,7 @@ class Simulation:
                 for p in self.system.cloud.rndservice.par[tsk]:
                     r.add("system/cloud", "service_{}_param_{}".format(tsk.name.lower(), p), self.system.cloud.rndservice.par[tsk][p])
 
-        for tsk in TaskScope.concrete():
+        for tsk in _CONCRETE_TASKS:
             r.add("system/cloud", "setup_{}_dist".format(tsk.name.lower()), self.system.cloud.rndsetup.var[tsk].name)
             for p in self.system.cloud.rndsetup.par[tsk]:
                 r.add("system/cloud", "service_{}_param_{}".format(tsk.name.lower(), p), self.system.cloud.rndsetup.par[tsk][p])
@@ -266,15 +343,16 @@ class Simulation:
                 r.add("state", "{}_{}".format(sys.name.lower(), tsk.name.lower()), self.system.state[sys][tsk])
 
         # Report - Statistics
+        # Notice that every measure is looked up once.
         for metric in sorted(self.metrics.performance_metrics.__dict__):
-            for sys in sorted(SystemScope, key=lambda x: x.name):
-                for tsk in sorted(TaskScope, key=lambda x: x.name):
-                    r.add("statistics", "{}_{}_{}_mean".format(metric, sys.name.lower(), tsk.name.lower()),
-                          getattr(self.metrics.performance_metrics, metric)[sys][tsk].mean())
-                    r.add("statistics", "{}_{}_{}_sdev".format(metric, sys.name.lower(), tsk.name.lower()),
-                          getattr(self.metrics.performance_metrics, metric)[sys][tsk].sdev())
-                    r.add("statistics", "{}_{}_{}_cint".format(metric, sys.name.lower(), tsk.name.lower()),
-                          getattr(self.metrics.performance_metrics, metric)[sys][tsk].cint(alpha))
+            measures = getattr(self.metrics.performance_metrics, metric)
+            for sys in _SORTED_SYSTEMS:
+                for tsk in _SORTED_TASKS:
+                    measure = measures[sys][tsk]
+                    prefix = "{}_{}_{}".format(metric, sys.name.lower(), tsk.name.lower())
+                    r.add("statistics", prefix + "_mean", measure.mean())
+                    r.add("statistics", prefix + "_sdev", measure.sdev())
+                    r.add("statistics", prefix + "_cint", measure.cint(alpha))
 
         return r
 
@@ -2,7 +2,7 @@
 Utilities for CSV file management.
 """
 
-from core.utils.file_utils import create_dir_tree, is_empty_file, empty_file
+from core.utils.file_utils import create_dir_tree
 from csv import DictReader
 
 
@@ -22,19 +22,16 @@ def save_csv(filename, names, data, append=False, skip_header=False, empty=False
     """
     create_dir_tree(filename)
 
-    if empty:
-        empty_file(filename)
-
-    mode = "a+" if append else "w+"
+    # Notice that emptying the file is the same as truncating it on open.
+    mode = "a+" if append and not empty else "w+"
 
     with open(filename, mode) as f:
-        if is_empty_file(filename) and not skip_header:
+        # Notice that in append mode the file is positioned at its end, hence it is empty iff the position is 0.
+        if f.tell() == 0 and not skip_header:
             f.write(",".join(map(str_csv, names)))
             f.write("\n")
 
-        for sample in data:
-            f.write(",".join(map(str, sample)))
-            f.write("\n")
+        f.writelines(",".join(map(str, sample)) + "\n" for sample in data)
 
 
 def str_csv(s):
@@ -52,8 +52,7 @@ def create_dir_tree(filename):
 def save_list_of_numbers(filename, numbers):
     os.makedirs(os.path.dirname(filename), exist_ok=True)
     with open(filename, "w+") as resfile:
-        for value in numbers:
-            resfile.write(str(value) + "\n")
+        resfile.writelines("{}\n".format(value) for value in numbers)
 
 
 def append_list_of_numbers(filename, numbers):
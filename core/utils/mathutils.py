@@ -37,6 +37,25 @@ def is_prime(n):
     return True
 
 
+def prime_factors(n):
+    """
+    Computes the distinct prime factors of n, by trial division.
+    :param n: (int) a positive integer.
+    :return: (List) the distinct prime factors of n, in ascending order.
+    """
+    factors = []
+    p = 2
+    while p * p <= n:
+        if n % p == 0:
+            factors.append(p)
+            while n % p == 0:
+                n //= p
+        p += 1 if p == 2 else 2
+    if n > 1:
+        factors.append(n)
+    return factors
+
+
 def are_coprime(a, b):
     """
     Check if a and b are coprime numbers.
@@ -248,10 +267,10 @@ def _g(x, multiplier, modulus):
     :param modulus: (int) a prime number.
     :return: (int) the next state of the generator.
     """
-    q = int(modulus / multiplier)
-    r = int(modulus % multiplier)
-    t = int(multiplier * (x % q) - r * int(x / q))
+    q = modulus // multiplier
+    r = modulus % multiplier
+    t = multiplier * (x % q) - r * (x // q)
     if t > 0:
-        return int(t)
+        return t
     else:
-        return int(t + modulus)
+        return t + modulus
@@ -4,7 +4,7 @@ Utility classes that realize reports for experiments.
 
 
 from collections import OrderedDict
-from core.utils.file_utils import create_dir_tree, empty_file
+from core.utils.file_utils import create_dir_tree
 from core.utils.csv_utils import save_csv
 
 
@@ -94,10 +94,8 @@ class SimpleReport(object):
         """
         create_dir_tree(filename)
 
-        if empty:
-            empty_file(filename)
-
-        mode = "a+" if append else "w+"
+        # Notice that emptying the file is the same as truncating it on open.
+        mode = "a+" if append and not empty else "w+"
 
         with open(filename, mode) as f:
             f.write(str(self))
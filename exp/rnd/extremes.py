@@ -35,6 +35,7 @@ DEFAULT_BINS = 1000  # >= 1000
 DEFAULT_D = 5  # >= 2
 DEFAULT_CONFIDENCE = 0.95  # >= 0.95
 DEFAULT_OUTDIR = "out/extremes"
+DEFAULT_WORKERS = None  # the number of processes testing streams in parallel (None: the number of CPUs)
 
 
 def run(g, samsize, bins, confidence, d, outdir):
@@ -47,7 +48,7 @@ def run(g, samsize, bins, confidence, d, outdir):
                          .format(g.get_modulus(), g.get_multiplier(), g.get_nstreams()))
 
     # Statistics: [(stream_1, chi_1),(stream_2,chi_2),...,(stream_n,chi_n)]
-    data = test.statistics(g, samsize, bins, d)
+    data = test.statistics(g, samsize, bins, d, workers=DEFAULT_WORKERS)
     save_csv(filename + ".csv", ["stream", "value"], data, empty=True)
 
     # Critical Bounds
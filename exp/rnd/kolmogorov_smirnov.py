@@ -34,6 +34,7 @@ DEFAULT_GENERATOR= MarcianiMultiStream(modulus=DEFAULT_MODULUS, multiplier=DEFAU
 DEFAULT_TEST = "extremes"
 DEFAULT_TEST_PARAMS = dict(samsize=10000, bins=1000, confidence=0.95, d=5)
 DEFAULT_OUTDIR = "out/kolmogorov-smirnov"
+DEFAULT_WORKERS = None  # the number of processes testing streams in parallel (None: the number of CPUs)
 SUPPORTED_TESTS = ("extremes")
 
 
@@ -52,7 +53,7 @@ def run(g, test_name, test_params, outdir=DEFAULT_OUTDIR):
         raise NotImplementedError("Kolmogorov-Smirnov on {} is not yet implemented".format(test_name))
         #data = uniformity_bivariate.statistics(generator, streams, samsize, bins)
     elif test_name == "extremes":
-        chi_square_statistics = extremes.statistics(g, test_params["samsize"], test_params["bins"], test_params["d"])
+        chi_square_statistics = extremes.statistics(g, test_params["samsize"], test_params["bins"], test_params["d"], workers=DEFAULT_WORKERS)
     elif test_name == "runsup":
         raise NotImplementedError("Kolmogorov-Smirnov on {} is not yet implemented".format(test_name))
         #data = runsup.statistics(generator, streams, samsize, bins)
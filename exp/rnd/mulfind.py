@@ -7,6 +7,7 @@ Output: FP, MC, FP/MC multipliers and the smallest/largest FP/MC multiplier, if
 
 Notes: results are stored in folder 'out/mulfind'.
 """
+import numpy as np
 from core.rnd.inspection import multiplier_check
 from core.utils.report import SimpleReport
 from core.utils.file_utils import save_list_of_numbers
@@ -33,14 +34,14 @@ def run(modulus, outdir=DEFAULT_OUTDIR):
     fp_multipliers = multiplier_check.get_fp_multipliers(modulus)
 
     logger.info("Computing FP/MC Multipliers for Modulus {}".format(modulus))
-    fpmc_multipliers = []
-    for candidate in fp_multipliers:
-        if candidate in mc_multipliers:
-            fpmc_multipliers.append(candidate)
+    # Notice that FP multipliers are filtered by the MC check, that is O(1), rather than by a scan of MC multipliers.
+    # Notice that multipliers are stored as int64 arrays, rather than lists of Python integers.
+    fp_multipliers = np.array(fp_multipliers, dtype=np.int64)
+    fpmc_multipliers = fp_multipliers[(modulus % fp_multipliers) < (modulus // fp_multipliers)]
 
     logger.info("Computing smallest/largest FP/MC Multipliers for Modulus {}".format(modulus))
-    smallest_fpmc_multiplier = min(fpmc_multipliers, default=None)
-    largest_fpmc_multiplier = max(fpmc_multipliers, default=None)
+    smallest_fpmc_multiplier = int(fpmc_multipliers.min()) if fpmc_multipliers.size else None
+    largest_fpmc_multiplier = int(fpmc_multipliers.max()) if fpmc_multipliers.size else None
 
     # Save raw data
     save_list_of_numbers(filename + "_mc.txt", mc_multipliers)
@@ -1,5 +1,5 @@
 import unittest
-from core.metrics.accumulator import WelfordAccumulator
+from core.metrics.accumulator import WelfordAccumulator, BUFFER_CAPACITY
 from random import randint
 import numpy as np
 import scipy.stats
@@ -47,4 +47,19 @@ class AccumulatorTest(unittest.TestCase):
         actual_cint = self.accumulator.cint(1-CONFIDENCE)
         print("expected_cint:", expected_cint)
         print("actual_cint:", actual_cint)
-        self.assertLessEqual(abs(expected_cint - actual_cint) / expected_cint, ERROR)
\ No newline at end of file
+        self.assertLessEqual(abs(expected_cint - actual_cint) / expected_cint, ERROR)
+
+    def test_buffered_values(self):
+        accumulator = WelfordAccumulator()
+        values = [randint(1, 1000) for _ in range(BUFFER_CAPACITY + BUFFER_CAPACITY // 2)]
+        for value in values[:10]:
+            accumulator.add_value(value)
+        self.assertEqual(10, accumulator.samsize())
+        self.assertAlmostEqual(np.mean(values[:10]), accumulator.mean(), PRECISION)
+        for value in values[10:]:
+            accumulator.add_value(value)
+        self.assertEqual(len(values), accumulator.samsize())
+        self.assertAlmostEqual(np.mean(values), accumulator.mean(), PRECISION)
+        self.assertLessEqual(abs(np.var(values) - accumulator.var()) / np.var(values), ERROR)
+        accumulator.reset()
+        self.assertEqual(0, accumulator.samsize())
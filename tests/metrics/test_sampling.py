@@ -1,3 +1,5 @@
+import os
+import tempfile
 import unittest
 from core.metrics.simulation_metrics import Sample
 from core.simulation.model.scope import SystemScope
@@ -19,7 +21,10 @@ class SamplingTest(unittest.TestCase):
                 for tsk in TaskScope:
                     getattr(self.sample.performance_metrics, performance_metric)[sys][tsk] = hash(performance_metric)
 
-        self.file_csv = "out/test_sample.csv"
+        # Notice that output files are written into a temporary directory, removed at test teardown.
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        self.file_csv = os.path.join(self.tmpdir.name, "out", "test_sample.csv")
 
     def test_save_csv(self):
         """
@@ -1,3 +1,5 @@
+import os
+import tempfile
 import unittest
 from core.metrics.simulation_metrics import SimulationMetrics
 from core.simulation.model.scope import SystemScope
@@ -7,38 +9,44 @@ from core.simulation.model.scope import TaskScope
 class SimulationMetricsTest(unittest.TestCase):
 
     def setUp(self):
-        self.simulation_metrics = SimulationMetrics(10)
+        self.simulation_metrics = SimulationMetrics(1)
 
-        for metric in self.simulation_metrics.performance_metrics.__dict__:
-            for sys in SystemScope:
-                for tsk in TaskScope:
-                    getattr(self.simulation_metrics.performance_metrics, metric)[sys][tsk].set_value(hash(metric))
+        # Drive two batches of one sample each, so that every batch mean equals the sampled value
+        self.rows = []
+        for batch, t_now in enumerate((10.0, 20.0)):
+            for counter in self.simulation_metrics.counters.__dict__:
+                for sys in SystemScope.subsystems():
+                    for i, tsk in enumerate(TaskScope.concrete(), start=1):
+                        getattr(self.simulation_metrics.counters, counter)[sys][tsk] += (batch + 1) * i
+
+            self.simulation_metrics.sampling(t_now)
 
-        self.simulation_metrics.register_batch()
+            row = [batch]
+            for metric in sorted(self.simulation_metrics.performance_metrics.__dict__):
+                for sys in SystemScope:
+                    for tsk in TaskScope:
+                        row.append(getattr(self.simulation_metrics.performance_metrics, metric)[sys][tsk].get_value())
+            self.rows.append(row)
 
-        for metric in self.simulation_metrics.performance_metrics.__dict__:
+        self.hdr = ["batch"]
+        for metric in sorted(self.simulation_metrics.performance_metrics.__dict__):
             for sys in SystemScope:
                 for tsk in TaskScope:
-                    getattr(self.simulation_metrics.performance_metrics, metric)[sys][tsk].set_value(hash(metric), batch=0)
+                    self.hdr.append("{}_{}_{}".format(metric, sys.name.lower(), tsk.name.lower()))
 
-        self.file_csv = "out/test_simulation_statistics.csv"
+        # Notice that output files are written into a temporary directory, removed at test teardown.
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        self.file_csv = os.path.join(self.tmpdir.name, "out", "test_simulation_statistics.csv")
 
     def test_save_csv(self):
         """
         Test the statistics saving to a CSV file.
         :return: None
         """
-        hdr = ["batch"]
-        row = [0]
+        self.assertEqual(2, self.simulation_metrics.n_batches)
 
-        for metric in sorted(self.simulation_metrics.performance_metrics.__dict__):
-            for sys in SystemScope:
-                for tsk in TaskScope:
-                    hdr.append("{}_{}_{}".format(metric, sys.name.lower(), tsk.name.lower()))
-                    row.append(hash(metric))
-        shdr = ",".join(map(str, hdr))
-        srow = ",".join(map(str, row))
-        expected = "{}\n{}\n".format(shdr, srow)
+        expected = "".join("{}\n".format(",".join(map(str, line))) for line in [self.hdr] + self.rows)
 
         self.simulation_metrics.save_csv(self.file_csv)
 
@@ -47,6 +55,20 @@ class SimulationMetricsTest(unittest.TestCase):
 
         self.assertEqual(expected, actual, "CSV file representation is not correct.")
 
+    def test_save_csv_batch(self):
+        """
+        Test the saving of a single batch to a CSV file.
+        :return: None
+        """
+        expected = "".join("{}\n".format(",".join(map(str, line))) for line in [self.hdr, self.rows[1]])
+
+        self.simulation_metrics.save_csv(self.file_csv, batch=1)
+
+        with open(self.file_csv, "r") as f:
+            actual = f.read()
+
+        self.assertEqual(expected, actual, "CSV file representation is not correct.")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,64 @@
+import unittest
+from core.rnd.rndgen import MarcianiSingleStream, MarcianiMultiStream
+from core.rnd.randomness import extremes
+
+
+class ExtremesTest(unittest.TestCase):
+
+    def test_observations(self):
+        """
+        Verify that the bulk observations equal the observations drawn one uniform at a time.
+        :return: None
+        """
+        SAMSIZE = 10000
+        BINS = 1000
+        D = 5
+
+        for generator_class in (MarcianiSingleStream, MarcianiMultiStream):
+            expected = extremes._observations_scalar(generator_class(), SAMSIZE, BINS, D)
+            actual = extremes.observations(generator_class(), SAMSIZE, BINS, D)
+            self.assertEqual(expected, actual, "{} is not correct!".format(generator_class.__name__))
+            self.assertEqual(SAMSIZE, sum(actual))
+
+    def test_statistics(self):
+        """
+        Verify that the statistics computed by a pool of processes equal the statistics computed sequentially,
+        and that the given generator is left untouched.
+        :return: None
+        """
+        SAMSIZE = 2000
+        BINS = 100
+        D = 5
+        STREAMS = 16
+
+        generator = MarcianiMultiStream(streams=STREAMS)
+        seeds = generator.get_seeds()
+
+        expected = extremes.statistics(generator, SAMSIZE, BINS, D, workers=1)
+        self.assertEqual(seeds, generator.get_seeds())
+        actual = extremes.statistics(generator, SAMSIZE, BINS, D, workers=2)
+        self.assertEqual(seeds, generator.get_seeds())
+
+        self.assertEqual(expected, actual)
+        self.assertEqual(list(range(STREAMS)), [stream for stream, _ in actual])
+
+    def test_statistics_streams(self):
+        """
+        Verify that every stream is tested as if selected on the multi-stream generator.
+        :return: None
+        """
+        SAMSIZE = 2000
+        BINS = 100
+        D = 5
+        STREAMS = 4
+
+        generator = MarcianiMultiStream(streams=STREAMS)
+        actual = extremes.statistics(generator, SAMSIZE, BINS, D)
+        for stream, chi in actual:
+            generator.stream(stream)
+            observed = extremes.observations(generator, SAMSIZE, BINS, D)
+            self.assertEqual(extremes._compute_chisquare_statistic(observed, SAMSIZE), chi)
+
+
+if __name__ == "__main__":
+    unittest.main()
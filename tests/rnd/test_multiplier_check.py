@@ -0,0 +1,48 @@
+import unittest
+from core.rnd.inspection import multiplier_check
+
+
+class MultiplierCheckTest(unittest.TestCase):
+
+    def test_is_fp_multiplier(self):
+        """
+        Verify that FP multipliers are exactly the multipliers with full period.
+        :return: None
+        """
+        for modulus in (2, 3, 5, 7, 11, 13, 127, 401):
+            for multiplier in range(1, modulus):
+                period = 1
+                x = multiplier
+                while x != 1:
+                    period += 1
+                    x = (multiplier * x) % modulus
+                expected = period == modulus - 1
+                actual = multiplier_check.is_fp_multiplier(multiplier, modulus)
+                self.assertEqual(expected, actual, "FP check for {} w.r.t. {} is not correct.".format(multiplier, modulus))
+
+    def test_get_mc_multipliers(self):
+        """
+        Verify that the MC multipliers are exactly the candidates passing the MC check.
+        :return: None
+        """
+        for modulus in (127, 401, 32749):
+            expected = [i for i in range(1, modulus) if multiplier_check.is_mc_multiplier(i, modulus)]
+            actual = multiplier_check.get_mc_multipliers(modulus).tolist()
+            self.assertEqual(expected, actual, "MC multipliers w.r.t. {} are not correct.".format(modulus))
+
+    def test_generate_fpmc_multipliers(self):
+        """
+        Verify that the generated FP/MC multipliers are exactly the FP multipliers passing the MC check.
+        :return: None
+        """
+        MODULUS = 401
+        MULTIPLIER = 3
+
+        expected = sorted(i for i in multiplier_check.get_fp_multipliers(MODULUS)
+                          if multiplier_check.is_mc_multiplier(i, MODULUS))
+        actual = sorted(multiplier_check.generate_fpmc_multipliers(MULTIPLIER, MODULUS))
+        self.assertEqual(expected, actual, "FP/MC multipliers w.r.t. {} are not correct.".format(MODULUS))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,5 +1,6 @@
 import unittest
 from core.rnd.rndgen import MarcianiSingleStream, MarcianiMultiStream
+from core.utils.mathutils import _g
 
 
 class RndgenTest(unittest.TestCase):
@@ -42,6 +43,118 @@ class RndgenTest(unittest.TestCase):
 
         self.assertEqual(generator.get_seed(), CHECK_VALUE, "{} is not correct!".format(generator.__class__.__name__))
 
+    def test_put_seed(self):
+        """
+        Verify that reseeding a generator restarts its sequence from the new seed.
+        :return: None
+        """
+        SEED = 123456789
+        CHECK_ITERS = 1000
+
+        for generator_class in (MarcianiSingleStream, MarcianiMultiStream):
+            expected_generator = generator_class(iseed=SEED)
+            actual_generator = generator_class(iseed=1)
+            actual_generator.put_seed(SEED)
+            self.assertEqual(SEED, actual_generator.get_seed(), "{} is not correct!".format(generator_class.__name__))
+            expected = [expected_generator.rnd() for _ in range(CHECK_ITERS)]
+            actual = [actual_generator.rnd() for _ in range(CHECK_ITERS)]
+            self.assertEqual(expected, actual, "{} is not correct!".format(generator_class.__name__))
+
+    def test_rnd_mersenne(self):
+        """
+        Verify that the Mersenne reduction (modulus 2^31-1) matches the Schrage reduction, and that the Schrage
+        reduction is still used for other moduli.
+        :return: None
+        """
+        CHECK_ITERS = 1000
+
+        for modulus, multiplier in ((2147483647, 48271), (32749, 16374)):
+            generator = MarcianiSingleStream(modulus=modulus, multiplier=multiplier, iseed=1)
+            x = 1
+            for _ in range(CHECK_ITERS):
+                generator.rnd()
+                x = _g(x, multiplier, modulus)
+                self.assertEqual(generator.get_seed(), x, "{} is not correct!".format(generator.__class__.__name__))
+
+    def test_rnd_stream(self):
+        """
+        Verify that selecting a stream and generating in a single call equals stream() followed by rnd().
+        :return: None
+        """
+        CHECK_ITERS = 1000
+
+        expected_generator = MarcianiMultiStream()
+        actual_generator = MarcianiMultiStream()
+
+        for i in range(CHECK_ITERS):
+            stream = (i * 7) % expected_generator.get_nstreams()
+            expected_generator.stream(stream)
+            self.assertEqual(expected_generator.rnd(), actual_generator.rnd_stream(stream))
+            self.assertEqual(expected_generator.get_seed(), actual_generator.get_seed())
+
+    def test_rnd_batch(self):
+        """
+        Verify that a batch of rnd numbers equals the sequence of single rnd numbers.
+        :return: None
+        """
+        CHECK_ITERS = 1000
+
+        for generator_class in (MarcianiSingleStream, MarcianiMultiStream):
+            expected_generator = generator_class()
+            actual_generator = generator_class()
+
+            expected = [expected_generator.rnd() for _ in range(CHECK_ITERS)]
+            actual = actual_generator.rnd_batch(CHECK_ITERS)
+
+            self.assertEqual(expected, actual, "{} is not correct!".format(generator_class.__name__))
+            self.assertEqual(expected_generator.get_seed(), actual_generator.get_seed(), "{} is not correct!".format(generator_class.__name__))
+
+    def test_rnd_array(self):
+        """
+        Verify that an array of rnd numbers equals the batch of rnd numbers, also for non Mersenne moduli.
+        :return: None
+        """
+        CHECK_ITERS = 1000
+
+        configurations = (
+            (MarcianiSingleStream, dict()),
+            (MarcianiSingleStream, dict(modulus=401, multiplier=3)),
+            (MarcianiMultiStream, dict()),
+            (MarcianiMultiStream, dict(modulus=401, multiplier=3, streams=4, jumper=5))
+        )
+
+        for generator_class, params in configurations:
+            expected_generator = generator_class(iseed=7, **params)
+            actual_generator = generator_class(iseed=7, **params)
+
+            for n in (0, 1, 3, CHECK_ITERS):
+                expected = expected_generator.rnd_batch(n)
+                actual = actual_generator.rnd_array(n).tolist()
+
+                self.assertEqual(expected, actual, "{} is not correct!".format(generator_class.__name__))
+                self.assertEqual(expected_generator.get_seed(), actual_generator.get_seed(), "{} is not correct!".format(generator_class.__name__))
+
+    def test_rnd_all(self):
+        """
+        Verify that advancing all streams at once equals advancing each stream separately.
+        :return: None
+        """
+        CHECK_ITERS = 10
+
+        expected_generator = MarcianiMultiStream()
+        actual_generator = MarcianiMultiStream()
+
+        for _ in range(CHECK_ITERS):
+            actual = actual_generator.rnd_all()
+            for stream in range(expected_generator.get_nstreams()):
+                expected_generator.stream(stream)
+                self.assertAlmostEqual(expected_generator.rnd(), actual[stream], places=15)
+
+        for stream in range(expected_generator.get_nstreams()):
+            expected_generator.stream(stream)
+            actual_generator.stream(stream)
+            self.assertEqual(expected_generator.get_seed(), actual_generator.get_seed())
+
 
 if __name__ == "__main__":
     unittest.main()
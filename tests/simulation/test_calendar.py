@@ -67,6 +67,51 @@ class CalendarTest(unittest.TestCase):
             self.assertEqual(_events[_idx], event)
             _idx += 1
 
+    def test_scheduling_many(self):
+        """
+        Verify the correctness of scheduling and unscheduling collections of events.
+        :return: None
+        """
+        rndgen = MarcianiMultiStream()
+
+        # Creation
+        calendar = NextEventCalendar()
+
+        # step 1: schedule
+        _events = [Event(event_type, rndgen.rnd()) for event_type in EventType for _ in range(10)]
+        nscheduled, nignored = calendar.schedule_many(_events)
+        self.assertEqual((len(_events), 0), (nscheduled, nignored))
+
+        # step 2: unschedule
+        calendar.unschedule_many([_ev for _ev in _events if _ev.type is EventType.ARRIVAL_TASK_2])
+        _events[:] = [x for x in _events if not x.type == EventType.ARRIVAL_TASK_2]
+
+        # step 3: test
+        _events.sort(key=lambda x: x.time)
+        for _ev in _events:
+            self.assertIs(_ev, calendar.get_next_event())
+        self.assertTrue(all(not e.active for _, _, e in calendar._events))
+
+    def test_unscheduling_last(self):
+        """
+        Verify that a calendar holding only unscheduled events is empty, and yields no next event.
+        :return: None
+        """
+        calendar = NextEventCalendar()
+
+        event = Event(EventType.ARRIVAL_TASK_1, 1.0)
+        calendar.schedule(event)
+        self.assertFalse(calendar.empty())
+
+        calendar.unschedule(event)
+        self.assertTrue(calendar.empty())
+        self.assertIsNone(calendar.get_next_event())
+
+        calendar.schedule(Event(EventType.ARRIVAL_TASK_1, 2.0))
+        calendar.unschedule(calendar._events[0][2])
+        self.assertIsNone(calendar.get_next_event())
+        self.assertTrue(calendar.empty())
+
 
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
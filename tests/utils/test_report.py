@@ -1,3 +1,5 @@
+import os
+import tempfile
 import unittest
 from core.utils.report import SimpleReport
 
@@ -20,8 +22,11 @@ class ReportTest(unittest.TestCase):
         self.r.add("Section-3", "2nd Value", 2.123)
         self.r.add("Section-3", "3rd Value", "Hello World")
 
-        self.file_txt = "test.txt"
-        self.file_csv = "test.csv"
+        # Notice that output files are written into a temporary directory, removed at test teardown.
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        self.file_txt = os.path.join(self.tmpdir.name, "test.txt")
+        self.file_csv = os.path.join(self.tmpdir.name, "test.csv")
 
     def test_string_representation(self):
         """